@@ -1,9 +1,11 @@
 from abc import ABC, abstractmethod
-import itertools
+import logging
 import math
 from typing import Callable, TypeVar, Type, cast, Generic
 from enum import Enum
 
+import numpy as np
+
 from c2d_math import Point, Line
 from c2d_update import UpdateManager
 from c2d_help import int_to_roman
@@ -12,6 +14,8 @@ from c2d_help import int_to_roman
 C = TypeVar("C", bound='Component')
 V = TypeVar("V")
 
+log = logging.getLogger(__name__)
+
 
 class Attribute(Generic[C, V]):
     """Represents an attribute of a component. Stores a value of a specific type and provides more information and functionality around it.
@@ -41,7 +45,7 @@ class Attribute(Generic[C, V]):
             self._value = value if isinstance(value, self.TYPE) else self.TYPE(value) #type: ignore
             if update:
                 self._component.model.update_manager.notify_observers(self._component.id, self.ID)
-                print(f"detected change in {self._component}, changed attribute: {self.NAME}")
+                log.debug("detected change in %s, changed attribute: %s", self._component, self.NAME)
         return filter_result
 
     def filter(self, value) -> tuple[bool, str]:
@@ -611,7 +615,7 @@ class Model:
     def clear(self):
         """Remove all components from the Model. Notify Model Observers of change."""
         if not self.is_empty():
-            [component_list.clear() for component_list in self.component_lists]
+            for component_list in self.component_lists: component_list.clear()
         self.update_manager.notify_observers()
 
     def is_empty(self) -> bool:
@@ -628,6 +632,16 @@ class Model:
         """Returns all Components of all types in the Model."""
         return [component for component_list in self.component_lists for component in component_list]
 
+    def node_coordinates(self) -> np.ndarray:
+        """Returns the coordinates of all Nodes in the Model as an array of shape (number of Nodes, 2), in the order of the Model's Nodes."""
+        return np.array([(node.x, node.y) for node in self.nodes], dtype=float).reshape(-1, 2)
+
+    def beam_node_indices(self) -> np.ndarray:
+        """Returns the indices of the start and end Node of every Beam in the array returned by node_coordinates, 
+        as an array of shape (number of Beams, 2)."""
+        index = {node: i for i, node in enumerate(self.nodes)}
+        return np.array([(index[beam.start_node], index[beam.end_node]) for beam in self.beams], dtype=int).reshape(-1, 2)
+
     def list_for_type(self, component_type: Type[C]) -> 'ComponentList[C]':
         """Returns the Models ComponentList for the specified type if it exists."""
         return cast('ComponentList[C]', next(component_list for component_list in self.component_lists if component_list.component_class == component_type))
@@ -641,29 +655,31 @@ class Model:
         return component_type.gen_id(i)
 
     def is_valid(self) -> bool:
-        """Returns True if the Model is valid, eg. ready for solving."""
-        return all([
-            not self.is_empty(),
-            len(self.forces) > 0,
-            self.has_three_reaction_forces(),
-            self.is_connected(),
-            self.is_stat_det(),
-            self.is_stable(),
-            not self.has_overlapping_beams()
-        ])
+        """Returns True if the Model is valid, eg. ready for solving. The checks are ordered from cheap to expensive and stop at the first failing one."""
+        return (not self.is_empty()
+            and len(self.forces) > 0
+            and self.has_three_reaction_forces()
+            and self.is_connected()
+            and self.is_stat_det()
+            and self.is_stable()
+            and not self.has_overlapping_beams())
+
+    def support_constraints(self) -> int:
+        """Returns the number of constraints of all Supports in the Model, eg. the number of unknown reaction forces."""
+        return sum(support.constraints for support in self.supports)
 
     def is_stat_det(self) -> bool:
         """Check if the model is statically determined and thus ready for analysis. Used for Model validation."""
-        return ((2 * len(self.nodes)) - (sum(support.constraints for support in self.supports) + len(self.beams))) == 0
+        return ((2 * len(self.nodes)) - (self.support_constraints() + len(self.beams))) == 0
 
     def is_stable(self) -> bool:
-        """Returns True if the Model is stable. Used for Model validation."""
-        return self.is_empty() or not any([
-            sum(support.constraints for support in self.supports) < 3,
-            self.supports_parallel(),
-            self.all_supports_intersect(),
-            not self.is_connected(),
-            self.has_non_triangular_shapes()])
+        """Returns True if the Model is stable. Used for Model validation. Stops at the first check that fails."""
+        return self.is_empty() or not (
+            self.support_constraints() < 3
+            or self.supports_parallel()
+            or self.all_supports_intersect()
+            or not self.is_connected()
+            or self.has_non_triangular_shapes())
 
     def is_connected(self) -> bool:
         """Returns True if the graph of the Model is connected. Meaning all Components in the Model are connected to each other.
@@ -681,19 +697,31 @@ class Model:
             visited: list[Node] = []
             def dfs(node: Node, visited: list[Node]):
                 visited.append(node)
-                [dfs(neighbor, visited) for neighbor in adj[node] if neighbor not in visited]
+                for neighbor in adj[node]:
+                    if neighbor not in visited: dfs(neighbor, visited)
             dfs(self.nodes[0], visited)
             return len(visited) == len(self.nodes)
 
     def has_three_reaction_forces(self) -> bool:
         """Returns True if the Model has exactly three reaction forces. 
         Calculated by counting the number of constraints for all Supports in the Model. Used for Model validation."""
-        return sum(support.constraints for support in self.supports) == 3
+        return self.support_constraints() == 3
 
     def has_overlapping_beams(self) -> bool:
-        """Returns False if the Model has Beams that are intersecting each other. Used for Model validation."""
-        beam_to_line: Callable[[Beam], Line] = lambda beam: Line(Point(beam.start_node.x, beam.start_node.y), Point(beam.end_node.x, beam.end_node.y))
-        return any(beam_to_line(b1).intersects(beam_to_line(b2)) for b1, b2 in itertools.combinations(self.beams, 2))
+        """Returns False if the Model has Beams that are intersecting each other. Used for Model validation.\n
+        Performs the same test as Line.intersects for all pairs of Beams at once on the arrays of Node coordinates."""
+        if len(self.beams) < 2:
+            return False
+        beams = self.node_coordinates()[self.beam_node_indices()]
+        start, delta = beams[:, 0], beams[:, 1] - beams[:, 0]
+        s_x, s_y, s_dx, s_dy = start[:, 0, None], start[:, 1, None], delta[:, 0, None], delta[:, 1, None] #first beam of pair in rows
+        l_x, l_y, l_dx, l_dy = start[None, :, 0], start[None, :, 1], delta[None, :, 0], delta[None, :, 1] #second beam of pair in columns
+        a = l_dx * (l_y - s_y) - l_dy * (l_x - s_x)
+        b = l_dx * s_dy - l_dy * s_dx
+        c = s_dx * (l_y - s_y) - s_dy * (l_x - s_x)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            intersects = (b != 0) & (0 < a / b) & (a / b < 1) & (0 < c / b) & (c / b < 1)
+        return bool(np.triu(intersects, k=1).any())
 
     def has_non_triangular_shapes(self):
         """Returns True if the Model contains non triangular Shapes. Every Beam in the Model should be connected in a way that it
@@ -807,13 +835,14 @@ class ComponentList(list[C]):
         self.update_manager: UpdateManager = update_manager
 
     def append(self, *components: C) -> None:
-        """Add item to the list and notify UpdateManager to update."""
-        for component in components: super().append(component)
+        """Add item(s) to the list and notify UpdateManager to update once for all of them."""
+        super().extend(components)
         self.update_manager.notify_observers()
 
     def remove(self, *components: C) -> None:
         """Remove item(s) from the list and notify UpdateManager to update."""
-        [super().remove(component) for component in components if component in self]
+        for component in components:
+            if component in self: super().remove(component)
         self.update_manager.notify_observers()
 
     def component_for_id(self, id: str) -> C | None:
@@ -33,7 +33,7 @@ class ControlPanel(Observer, ttk.Frame):
         self.bind("<Right>", lambda *ignore: self.selected_step.set((self.selected_step.get() + 1) % (len(self.steps) + 2)))
 
         focus_widgets = [self.nametowidget(self.winfo_parent()), self, self._step_label, self._play_button, self._scale, self._speed_selection]
-        [widget.bind("<ButtonRelease-1>", lambda event: self.focus_set()) for widget in focus_widgets]
+        for widget in focus_widgets: widget.bind("<ButtonRelease-1>", lambda event: self.focus_set())
 
     def create_step_label(self):
         """Create the label that gives information about the current step at the top of the control panel."""
@@ -6,7 +6,7 @@ import math
 from c2d_app import TwlApp
 from c2d_style import Colors
 from c2d_diagram import TwlDiagram, Shape, ComponentShape
-from c2d_math import Point, Line, Polygon
+from c2d_math import Point, Line, Polygon, segment_distance_squared
 from c2d_cremona_algorithm import CremonaAlgorithm
 from c2d_components import Component, Node, Support, Force
 
@@ -70,8 +70,6 @@ class ResultShape(ComponentShape[Force]):
                             arrowshape=self.ARROW, 
                             tags=[*self.TAGS, str(self.component.id)])
         self.tk_shapes[self.line_tk_id] = Polygon(self.start, self.end)
-        self.diagram.tag_raise(self.label_bg_tk_id)
-        self.diagram.tag_raise(self.label_tk_id)
 
     @property
     def line_coords(self):
@@ -80,7 +78,7 @@ class ResultShape(ComponentShape[Force]):
 
     def is_at(self, x: float, y: float) -> bool:
         """Returns True if the shape is at the specified position in the diagram, False otherwise."""
-        return Point(x, y).distance_to_line(self.line_coords) < self.WIDTH/2
+        return segment_distance_squared(x, y, self.start.x, self.start.y, self.end.x, self.end.y) < (self.WIDTH/2)**2
 
     @property
     def label_position(self) -> Point:
@@ -135,7 +133,7 @@ class SketchShape(ComponentShape[Force]):
 
     def is_at(self, x: float, y: float) -> bool:
         """Returns True if the shape is at the specified position in the diagram, False otherwise."""
-        return Point(x, y).distance_to_line(self.line_coords) < self.WIDTH/2
+        return segment_distance_squared(x, y, self.start.x, self.start.y, self.end.x, self.end.y) < (self.WIDTH/2)**2
 
 
 class CremonaDiagram(TwlDiagram):
@@ -167,11 +165,11 @@ class CremonaDiagram(TwlDiagram):
         self.steps = CremonaAlgorithm.get_steps()
         pos = self.START_POINT
         pre_sketch_pos = None
+        result_shapes: dict[str, ResultShape] = {} #first ResultShape drawn for each Force id
         for node, force, component, sketch in self.steps:
-            existing_shape = next((shape for shape in self.component_shapes if (isinstance(shape, ResultShape) and shape.component.id == force.id)), None)
+            existing_shape = result_shapes.get(force.id)
             if node and existing_shape:
-                coords = self.coords(existing_shape.line_tk_id)
-                pos = Point(coords[2], coords[3])
+                pos = Point(existing_shape.end.x, existing_shape.end.y)
                 if type(component) in (Support, Force):
                     continue
             if sketch:
@@ -181,29 +179,34 @@ class CremonaDiagram(TwlDiagram):
                 if pre_sketch_pos:
                     pos = Point(pre_sketch_pos.x, pre_sketch_pos.y)
                     pre_sketch_pos = None
-            pos = self.draw_force(pos, force, component, sketch)
+            pos, shape = self.draw_force(pos, force, component, sketch)
+            if isinstance(shape, ResultShape):
+                result_shapes.setdefault(force.id, shape)
         if self.steps and TwlApp.settings().force_spacing.get():
             self.force_spacing()
+        self.raise_labels() #labels are raised above the lines once after all shapes are drawn
         super().update_observer(component_id, attribute_id)
         self.display_step(self.selected_step.get())
 
-    def draw_force(self, start: Point, force: Force, component: Component, sketch: bool) -> Point:
-        """Draw or pre draw a force in the diagram."""
+    def draw_force(self, start: Point, force: Force, component: Component, sketch: bool) -> tuple[Point, ResultShape | SketchShape]:
+        """Draw or pre draw a force in the diagram. Returns the end of the force, where the next force starts, and the shape that was created. 
+        The end of a SketchShape's line is extended, so it is not used as the end of the force."""
         angle = math.radians((force.angle + 180) % 360) if type(component) in (Support, Force) else math.radians(force.angle)
         start = Point(start.x, start.y)
         end = Point(start.x + force.strength * math.sin(angle) * self.SCALE, start.y + (-force.strength * math.cos(angle) * self.SCALE))
-        if sketch:
-            self.shapes.append(SketchShape(Point(start.x, start.y), Point(end.x, end.y), force, self))
-        else:
-            self.shapes.append(ResultShape(Point(start.x, start.y), Point(end.x, end.y), force, self))
-        return Point(end.x, end.y)
+        shape_type = SketchShape if sketch else ResultShape
+        shape = shape_type(Point(start.x, start.y), Point(end.x, end.y), force, self)
+        self.shapes.append(shape)
+        return Point(end.x, end.y), shape
 
     def force_spacing(self):
         """Add spacing between beam forces, external force and reaction forces in the diagram."""
         force_forces = [force for node, force, component, sketch in self.steps if not node and isinstance(component, Force)]
-        [self.shapes_for(force)[0].move(BaseLineShape.SPACING, 0) for force in force_forces]
+        for force in force_forces:
+            self.shapes_for(force)[0].move(BaseLineShape.SPACING, 0)
         support_forces = [force for node, force, component, sketch in self.steps if not node and isinstance(component, Support)]
-        [self.shapes_for(force)[0].move(2 * BaseLineShape.SPACING, 0) for force in support_forces]
+        for force in support_forces:
+            self.shapes_for(force)[0].move(2 * BaseLineShape.SPACING, 0)
         self.shapes.append(BaseLineShape(Point(self.START_POINT.x + BaseLineShape.SPACING, self.START_POINT.y), self))
         coords = self.coords(self.find_withtag(force_forces[len(force_forces) - 1].id)[0])
         self.shapes.append(BaseLineShape(Point(coords[2], coords[3]), self))
@@ -217,6 +220,7 @@ class CremonaDiagram(TwlDiagram):
     def step_visibility(self, selected_step: int):
         """Hide all forces drawn after the selected step."""
         visible: set[Shape] = set()
+        settings = self.label_settings()
         for i, step in enumerate(self.steps):
             shape_type = SketchShape if step[3] else ResultShape
             shape = self.shapes_of_type_for(shape_type, step[1])[0]
@@ -224,7 +228,7 @@ class CremonaDiagram(TwlDiagram):
                 visible.add(shape)
             is_visible = shape in visible
             shape.set_visible(is_visible)
-            shape.set_label_visible(is_visible and self.label_visible(shape))
+            shape.set_label_visible(is_visible and self.label_visible(shape, settings))
 
     def step_highlighting(self, selected_step: int):
         """Highlights all forces on current node and current force. Also makes highlighted lines slightly thicker."""
@@ -259,7 +263,11 @@ class CremonaDiagram(TwlDiagram):
         """Get all shapes in the diagram that represent forces that are connected to the Node."""
         return [self.shapes_of_type_for(SketchShape if step[3] else ResultShape, step[1])[0] for step in self.steps if step[0] == node]
 
-    def label_visible(self, shape: Shape) -> bool:
+    def label_settings(self) -> dict[type[Shape], bool]:
+        """Returns the label setting for the ResultShapes in this diagram."""
+        return {ResultShape: TwlApp.settings().show_cremona_labels.get()}
+
+    def label_visible(self, shape: Shape, settings: dict[type[Shape], bool]) -> bool:
         """Return if a label should be visible for the Shape in this diagram. Labels are hidden for 0 forces and pre-sketched forces.
         Also hidden if the label option is disabled in settings."""
-        return isinstance(shape, ResultShape) and round(shape.component.strength, 2) != 0 and TwlApp.settings().show_cremona_labels.get()
\ No newline at end of file
+        return isinstance(shape, ResultShape) and round(shape.component.strength, 2) != 0 and settings[ResultShape]
\ No newline at end of file
@@ -19,8 +19,7 @@ class SelectNodeTool(Tool):
 
     def action(self, event) -> bool:
         """NodeShape is searched for in diagram at event position. If it exists the selected step is changed."""
-        node_shapes = [shape for shape in self.diagram.component_shapes if isinstance(shape, NodeShape)]
-        node_shape = self.diagram.find_shape_of_list_at(node_shapes, event.x, event.y)
+        node_shape = self.diagram.find_shape_of_type_at(Node, event.x, event.y)
         if node_shape:
             step = next(i for i, step in enumerate(self.diagram.steps) if step[0] == node_shape.component) + 1
             self.diagram.selected_step.set(step)
@@ -38,15 +37,13 @@ class CremonaModelDiagram(ResultModelDiagram):
         self.selected_step: tk.IntVar = selected_step
         self.selected_step.trace_add("write", lambda *ignore: self.display_step(self.selected_step.get()))
         self.steps: list[tuple[Node | None, Force, Component, bool]] = []
+        self.tag_bind(NodeShape.CIRCLE_TAG, "<Enter>", lambda event: event.widget.config(cursor="hand2"))
+        self.tag_bind(NodeShape.CIRCLE_TAG, "<Leave>", lambda event: event.widget.config(cursor=""))
 
     def update_observer(self, component_id: str="", attribute_id: str=""):
         """Update the diagram with new steps from CremonaAlgorithm."""
         super().update_observer(component_id, attribute_id)
         self.steps = CremonaAlgorithm.get_steps()
-        node_shapes = [shape for shape in self.component_shapes if isinstance(shape, NodeShape)]
-        for node_shape in node_shapes:
-            self.tag_bind(node_shape.circle_tk_id, "<Enter>", lambda event: event.widget.config(cursor="hand2"))
-            self.tag_bind(node_shape.circle_tk_id, "<Leave>", lambda event: event.widget.config(cursor=""))
 
     def display_step(self, selected_step: int):
         """Display a step of CremonaAlgorithm in CremonaModelDiagram."""
@@ -57,13 +54,18 @@ class CremonaModelDiagram(ResultModelDiagram):
 
     def step_visibility(self, selected_step: int):
         """Set the visibility of the arrow and circle symbols on the Beams, depending on the selected step."""
-        [shape.set_visible(False) for shape in self.shapes if isinstance(shape, BeamForceShape)]
+        beam_force_shapes = [shape for shape in self.shapes if isinstance(shape, BeamForceShape)]
+        for shape in beam_force_shapes:
+            shape.set_visible(False)
         if selected_step <= len(self.steps):
             for i in range(1, selected_step + 1):
-                shapes = [shape for shape in self.shapes_of_type_for(BeamForceShape, self.steps[i - 1][2]) if not self.steps[i - 1][3]]
-                [shape.set_visible(True) for shape in shapes]
+                if self.steps[i - 1][3]:
+                    continue
+                for shape in self.shapes_of_type_for(BeamForceShape, self.steps[i - 1][2]):
+                    shape.set_visible(True)
         if selected_step == len(self.steps) + 1:
-            [shape.set_visible(True) for shape in self.shapes if isinstance(shape, BeamForceShape)]
+            for shape in beam_force_shapes:
+                shape.set_visible(True)
 
     def step_highlighting(self, selected_step: int):
         """Highlight the Components at the current Node."""
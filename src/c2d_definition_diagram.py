@@ -1,4 +1,5 @@
 from abc import abstractmethod
+import logging
 import tkinter as tk
 from tkinter import ttk
 from typing import Generic, TypeVar
@@ -7,13 +8,14 @@ from c2d_app import TwlApp
 from c2d_style import Colors, FONT
 from c2d_images import add_png_by_name
 from c2d_widgets import BorderFrame, CustomEntry, ValidationText
-from c2d_update import UpdateManager
 from c2d_math import Point, Line
 from c2d_help import f_range
-from c2d_components import Attribute, Component, Model, Node, Beam, Support, Force
+from c2d_components import Attribute, Component, Node, Beam, Support, Force
 from c2d_diagram import Tool
 from c2d_model_diagram import ModelDiagram, ComponentShape, NodeShape, BeamShape, SupportShape, ForceShape
 
+log = logging.getLogger(__name__)
+
 
 class SelectTool(Tool):
     """Tool used to select shapes in the diagram. Supports click selection, rectangle selection and shift selection."""
@@ -27,6 +29,7 @@ class SelectTool(Tool):
         """Create an instance of SelectTool."""
         super().__init__(diagram)
         self.selection_rect: int | None = None
+        self._selectable_shapes: tuple[list[ComponentShape], list[ComponentShape]] = ([], [])
 
     def activate(self):
         """Activate tool by binding keys to functions."""
@@ -47,15 +50,20 @@ class SelectTool(Tool):
     def reset(self):
         """Reset tool by removing selection rectangle and clearing selection."""
         super().reset()
-        if self.selection_rect:
-            self.diagram.delete(self.selection_rect)
-            self.selection_rect = None
-        [shape.deselect() for shape in self.diagram.selection.copy()]
+        self.remove_selection_rect()
+        if self.diagram.selection:
+            for shape in list(self.diagram.selection):
+                shape.deselect()
 
     @property
     def selectable_shapes(self) -> list[ComponentShape]:
-        """Get all shapes in the diagram that are selectable."""
-        return list(filter(lambda shape: isinstance(shape.component, (Beam, Support, Force)), self.diagram.component_shapes))
+        """Get all shapes in the diagram that are selectable. Only filtered again when the diagram's ComponentShapes changed."""
+        component_shapes, selectable_shapes = self._selectable_shapes
+        if component_shapes is not self.diagram.component_shapes:
+            component_shapes = self.diagram.component_shapes
+            selectable_shapes = [shape for shape in component_shapes if isinstance(shape.component, (Beam, Support, Force))]
+            self._selectable_shapes = component_shapes, selectable_shapes
+        return selectable_shapes
 
     def action(self, event) -> bool:
         """Executed when mouse button is pressed. Adjusts Mouse position for scrolling and zooming.
@@ -86,6 +94,12 @@ class SelectTool(Tool):
         self.diagram.coords(self.selection_rect, start_x, start_y, event.x, event.y)
         #self.diagram.update_coords_label(event)
 
+    def remove_selection_rect(self):
+        """Remove the selection rectangle from the diagram if it exists."""
+        if self.selection_rect:
+            self.diagram.delete(self.selection_rect)
+            self.selection_rect = None
+
     def end_rect_selection(self, event):
         """End the rectangle selection and process it when the user releases the left mouse button."""
         if not self.selection_rect:
@@ -95,8 +109,9 @@ class SelectTool(Tool):
         p2 = Point(x2, y2)
         p1.scale(1 / (self.diagram.current_zoom.get() / 100))
         p2.scale(1 / (self.diagram.current_zoom.get() / 100))
-        print(f"Selected area: ({p1.x}, {p1.y}) to ({p2.x}, {p2.y})")
-        selection = [shape for shape in self.selectable_shapes if all(polygon.in_bounds(p1, p2) for polygon in shape.tk_shapes.values())]
+        log.debug("Selected area: (%s, %s) to (%s, %s)", p1.x, p1.y, p2.x, p2.y)
+        candidates = set(self.diagram.shapes_overlapping(min(x1, x2), min(y1, y2), max(x1, x2), max(y1, y2))) #shapes inside the rectangle have to overlap it
+        selection = [shape for shape in self.selectable_shapes if shape in candidates and all(polygon.in_bounds(p1, p2) for polygon in shape.tk_shapes.values())]
         self.process_selection(event, *selection)
 
     def process_selection(self, event, *selection: ComponentShape):
@@ -108,9 +123,9 @@ class SelectTool(Tool):
                     shape.deselect()
                 else:
                     shape.select()
-            if self.selection_rect:
-                self.diagram.delete(self.selection_rect)
-                self.selection_rect = None
+            self.remove_selection_rect()
+        elif list(self.diagram.selection) == list(selection):
+            self.remove_selection_rect() #same shapes selected again, keep selection instead of deselecting and selecting them again
         else:
             self.reset()
             for shape in selection:
@@ -118,9 +133,9 @@ class SelectTool(Tool):
 
     def delete_selected(self, event):
         """Delete all shapes in current selection."""
-        TwlApp.update_manager().pause_observing()
-        [shape.component.delete() for shape in self.diagram.selection]
-        TwlApp.update_manager().resume_observing()
+        with TwlApp.update_manager().paused():
+            for shape in list(self.diagram.selection):
+                shape.component.delete()
         self.reset()
 
 
@@ -146,6 +161,7 @@ class TempBeamShape(BeamShape):
     def __init__(self, beam: Beam, diagram: 'DefinitionDiagram') -> None:
         """Create an instance of TempBeamShape."""
         super().__init__(beam, diagram)
+        self.diagram.tag_lower(self.line_tk_id, NodeShape.TAG)
         self.scale(self.diagram.current_zoom.get() / 100)
         self.set_label_visible(False)
 
@@ -159,6 +175,8 @@ class TempSupportShape(SupportShape):
     def __init__(self, support: Support, diagram: 'DefinitionDiagram') -> None:
         """Create an instance of TempSupportShape."""
         super().__init__(support, diagram)
+        self.diagram.tag_lower(self.triangle_tk_id, NodeShape.TAG)
+        self.diagram.tag_lower(self.line_tk_id, NodeShape.TAG)
         self.scale(self.diagram.current_zoom.get() / 100)
         self.set_label_visible(False)
 
@@ -235,9 +253,8 @@ class ComponentTool(Generic[C], Tool):
 
     def _create_component(self) -> C:
         """Create the component. Update manager is paused during component creation to avoid multiple updates."""
-        TwlApp.update_manager().pause_observing()
-        component = self.create_component()
-        TwlApp.update_manager().resume_observing()
+        with TwlApp.update_manager().paused():
+            component = self.create_component()
         self.reset()
         return component
 
@@ -339,7 +356,7 @@ class ComponentToolPopup(tk.Toplevel):
 
     def update_component(self):
         """Updates the tool's component's attributes with the values from the popup entries."""
-        [attr.set_value(entry.get(), False) for attr, entry in self.entries.items()]
+        for attr, entry in self.entries.items(): attr.set_value(entry.get(), False)
 
     def create_label(self, text: str, column: int, row: int, columnspan: int=1):
         """Create a text label in the popup."""
@@ -367,8 +384,8 @@ class ComponentToolPopup(tk.Toplevel):
         bd_color = Colors.BLACK if self.has_focus.get() else Colors.VERY_LIGHT_GRAY
         fg_color = Colors.BLACK if self.has_focus.get() else Colors.VERY_DARK_GRAY
         bg_color = Colors.WHITE
-        [entry.configure(bg=bg_color, fg=fg_color) for entry in self.entries.values()]
-        [label.configure(bg=bg_color, fg=fg_color) for label in self.labels]
+        for entry in self.entries.values(): entry.configure(bg=bg_color, fg=fg_color)
+        for label in self.labels: label.configure(bg=bg_color, fg=fg_color)
         self.configure(bg=bd_color)
         self.background.configure(bg=bg_color)
         self.content.configure(bg=bg_color)
@@ -393,6 +410,7 @@ class BeamTool(ComponentTool[Beam]):
         super().__init__(diagram)
         self.start_node: Node | None = None
         self.end_node: Node | None = None
+        self._preview_node: Node = Node.dummy()
 
     def reset(self):
         """Reset the tool by deleting temp shape and resetting selected/created Nodes."""
@@ -441,16 +459,23 @@ class BeamTool(ComponentTool[Beam]):
         if not self.start_node:
             if not existing_node:
                 self.diagram.delete_temp_shapes()
-                TempNodeShape(Node.dummy(event.x, event.y), self.diagram)
+                TempNodeShape(self.preview_node(event.x, event.y), self.diagram)
             return False
         else:
             if self.holding_shift_key(event):
                 self.shift_snap_line(event)
-            self.end_node = existing_node if existing_node else Node.dummy(event.x, event.y)
+            self.end_node = existing_node if existing_node else self.preview_node(event.x, event.y)
             self.component._start_node._value = self.start_node
             self.component._end_node._value  = self.end_node
             return True
 
+    def preview_node(self, x: float, y: float) -> Node:
+        """Get the dummy Node used to preview a new Node at the cursor position. 
+        The same Node is moved for every mouse movement instead of creating a new dummy Node each time."""
+        self._preview_node._x._value = x
+        self._preview_node._y._value = y
+        return self._preview_node
+
     def shift_snap_line(self, event):
         """Shift snap the position of the end Node to the closest 45 degree angle from the start Node depending on the position of the cursor."""
         assert(self.start_node)
@@ -520,7 +545,8 @@ class SupportTool(ComponentTool[Support]):
         if not self.node:
             hovering_node = self.diagram.find_component_of_type_at(Node, event.x, event.y)
             if hovering_node:
-                TempSupportShape(Support(Model(UpdateManager()), hovering_node), self.diagram)
+                self.component._node._value = hovering_node
+                TempSupportShape(self.component, self.diagram)
             return False
         else:
             line = Line(Point(self.node.x, self.node.y), Point(event.x, event.y))
@@ -579,7 +605,8 @@ class ForceTool(ComponentTool[Force]):
         if not self.node:
             hovering_node = self.diagram.find_component_of_type_at(Node, event.x, event.y)
             if hovering_node:
-                TempForceShape(Force(Model(UpdateManager()), hovering_node), self.diagram)
+                self.component._node._value = hovering_node
+                TempForceShape(self.component, self.diagram)
             return False
         else:
             line = Line(Point(self.node.x, self.node.y), Point(event.x, event.y))
@@ -676,6 +703,14 @@ class DefinitionDiagram(ModelDiagram):
         angle_guide_state = tk.NORMAL if TwlApp.settings().show_angle_guide.get() else tk.HIDDEN
         self.itemconfigure(self.angle_guide, state=angle_guide_state)
 
+    def shapes_moved(self):
+        """Update the diagram after shapes were moved. The grid and angle guide depend on the scrollregion, 
+        so the diagram is refreshed if the moved shapes changed it."""
+        scrollregion = self.get_scrollregion()
+        super().shapes_moved()
+        if self.get_scrollregion() != scrollregion:
+            self.refresh()
+
     def update_observer(self, component_id: str="", attribute_id: str=""):
         """Update the diagram by updating the visible components and the validation text."""
         super().update_observer(component_id, attribute_id)
@@ -740,8 +775,10 @@ class DefinitionDiagram(ModelDiagram):
         text = self.validation_text
         text.clear()
         if text.is_expanded:
-            text.text_add(self.stat_determ_text(), "stat_determ", Colors.GREEN if TwlApp.model().is_stat_det() else Colors.RED)
-            text.text_add(self.stable_text(), "stable", Colors.GREEN if TwlApp.model().is_stable() else Colors.RED)
+            stat_determ_text, is_stat_det = self.stat_determ_text()
+            text.text_add(stat_determ_text, "stat_determ", Colors.GREEN if is_stat_det else Colors.RED)
+            stable_text, is_stable = self.stable_text()
+            text.text_add(stable_text, "stable", Colors.GREEN if is_stable else Colors.RED)
             if not TwlApp.model().has_three_reaction_forces():
                 text.text_add("\nThere have to be exactly 3 reaction forces.", "reaction_forces", Colors.RED)
             if len(TwlApp.model().forces) == 0:
@@ -753,18 +790,19 @@ class DefinitionDiagram(ModelDiagram):
             text.text_add(f"The model is {"" if is_valid else "in"}valid.", "valid", Colors.GREEN if is_valid else Colors.RED)
         text.add_button()
 
-    def stat_determ_text(self) -> str:
-        """Get the explanation text about static determinacy."""
+    def stat_determ_text(self) -> tuple[str, bool]:
+        """Get the explanation text about static determinacy and whether the Model is statically determinate."""
         nodes = len(TwlApp.model().nodes)
         equations = 2 * nodes
-        constraints = sum(support.constraints for support in TwlApp.model().supports)
+        constraints = TwlApp.model().support_constraints()
         beams = len(TwlApp.model().beams)
         unknowns = constraints + beams
         f = equations - unknowns
-        return f"f = {f}, the model is statically {"" if f == 0 else "in"}determinate.\n{equations} equations (2 * {nodes} nodes)\n{unknowns} unknowns ({constraints} for supports, {beams} for beams)"
+        text = f"f = {f}, the model is statically {"" if f == 0 else "in"}determinate.\n{equations} equations (2 * {nodes} nodes)\n{unknowns} unknowns ({constraints} for supports, {beams} for beams)"
+        return text, f == 0
 
-    def stable_text(self) -> str:
-        """Get the explanation text about Model stability."""
+    def stable_text(self) -> tuple[str, bool]:
+        """Get the explanation text about Model stability and whether the Model is stable."""
         stable = TwlApp.model().is_stable()
         text = f"\nThe model is {"stable" if stable else "not stable"}."
         if not stable:
@@ -772,7 +810,7 @@ class DefinitionDiagram(ModelDiagram):
             text += f"{"\nReaction forces intersect in single point." if TwlApp.model().all_supports_intersect() else ""}"
             text += f"{"\nThere are non-triangular shapes." if TwlApp.model().has_non_triangular_shapes() else ""}"
             text += f"{"\nThe model is not connected." if not TwlApp.model().is_connected() else ""}"
-        return text
+        return text, stable
 
     def update_coords_label(self, event):
         """Update the cursor coordinate label at the bottom right of the diagram."""
@@ -1,3 +1,4 @@
+import logging
 import tkinter as tk
 from tkinter import ttk
 from typing import TypeVar, Generic, Type
@@ -10,6 +11,8 @@ from c2d_images import add_png_by_name
 from c2d_components import Component, IdAttribute
 from c2d_math import Point, Polygon
 
+log = logging.getLogger(__name__)
+
 
 class Shape():
     """Represents a generic Shape in the diagram."""
@@ -24,6 +27,7 @@ class Shape():
         """Create an instance of Shape."""
         self.diagram: 'TwlDiagram' = diagram
         self.tk_shapes: dict[int, Polygon] = {} #all tk_ids related to this shape with their position in the diagram
+        self.visible: bool = True
 
     def scale(self, factor: float):
         """Scale the shape with a factor. Takes all tkinter shapes connected to this shape 
@@ -32,6 +36,11 @@ class Shape():
             coords = [coord * factor for point in polygon.points for coord in (point.x, point.y)]
             self.diagram.coords(tk_id, coords)
 
+    def redraw(self):
+        """Apply the stored polygons to the tkinter shapes connected to this shape at the current scale of the diagram. 
+        Used when a single shape changed, instead of refreshing all shapes of the diagram."""
+        self.scale(self.diagram.current_zoom.get() / 100)
+
     def move(self, x: int, y: int):
         """Move the shape by the specified amount in the x and y direction 
         by moving them directly in the diagram and also moving the position of the stored polygons."""
@@ -41,6 +50,7 @@ class Shape():
 
     def set_visible(self, visible: bool):
         """Set the visibility state of all tkinter shapes connected to this shape."""
+        self.visible = visible
         state = tk.NORMAL if visible else tk.HIDDEN
         for tk_id in self.tk_shapes.keys():
             self.diagram.itemconfig(tk_id, state=state)
@@ -93,17 +103,20 @@ class ComponentShape(Generic[C], Shape, Observer):
         for tk_id in self.tk_shapes.keys():
             self.diagram.delete(tk_id)
         self.diagram.shapes.remove(self)
+        self.diagram._component_shapes = None
+        self.diagram._shapes_by_tk_id = None
+        self.component.model.update_manager.unregister_observer(self)
 
     def select(self):
-        """Append this shape to the selection of the diagram and style all of it's tkinter shapes with the shape's selected style."""
+        """Add this shape to the selection of the diagram and style all of it's tkinter shapes with the shape's selected style."""
         for tk_id in self.tk_shapes.keys():
             tags = self.diagram.gettags(tk_id)
             if self.LABEL_TAG in tags:
                 self.diagram.itemconfig(tk_id, fill=self.SELECTED_COLOR)
             elif self.LABEL_BG_TAG not in tags:
                 self.diagram.itemconfig(tk_id, self.selected_style(*tags))
-        self.diagram.selection.append(self)
-        print(f"selected: {self.component.id}")
+        self.diagram.selection[self] = None
+        log.debug("selected: %s", self.component.id)
 
     def deselect(self):
         """Remove this shape from the selection of the diagram and style all of it's tkinter shapes with the shape's default style."""
@@ -113,8 +126,8 @@ class ComponentShape(Generic[C], Shape, Observer):
                 self.diagram.itemconfig(tk_id, fill=Colors.BLACK)
             elif self.LABEL_BG_TAG not in tags:
                 self.diagram.itemconfig(tk_id, self.default_style(*tags))
-        self.diagram.selection.remove(self)
-        print(f"deselected: {self.component.id}")
+        del self.diagram.selection[self]
+        log.debug("deselected: %s", self.component.id)
 
     @abstractmethod
     def default_style(self, *tags: str) -> dict[str, str]:
@@ -127,22 +140,26 @@ class ComponentShape(Generic[C], Shape, Observer):
         pass
 
     def scale(self, factor: float):
-        """Scale the label."""
+        """Scale the label. The font is only configured if the scale changed, because tkinter lays out the text again for every font change."""
         super().scale(factor)
-        self.diagram.itemconfig(self.label_tk_id, font=('Helvetica', int(self.LABEL_SIZE * factor)))
+        if factor != self._label_factor:
+            self._label_factor = factor
+            self.diagram.itemconfig(self.label_tk_id, font=('Helvetica', int(self.LABEL_SIZE * factor)))
 
     def draw_label(self):
         """Draw the label at the position specified in the shapes label position and with the value of the shape's component's id."""
         label_pos = self.label_position
-        self.label_tk_id, self.label_bg_tk_id = self.diagram.create_text_with_bg(label_pos.x, label_pos.y, 
+        self.label_tk_id, self.label_bg_tk_id, bounds = self.diagram.create_text_with_bg(label_pos.x, label_pos.y, 
                                  text=self.component.id, 
                                  tags=[*self.TAGS, str(self.component.id)],
                                  label_tag=self.LABEL_TAG,
                                  bg_tag=self.LABEL_BG_TAG,
                                  font=('Helvetica', self.LABEL_SIZE))
-        self.tk_shapes[self.label_tk_id] = Polygon(Point(self.label_position.x, self.label_position.y))
-        x1, x2, y1, y2 = self.diagram.bbox(self.label_tk_id)
-        self.tk_shapes[self.label_bg_tk_id] = Polygon(Point(x1, x2), Point(y1, y2))
+        self.tk_shapes[self.label_tk_id] = Polygon(Point(label_pos.x, label_pos.y))
+        x1, y1, x2, y2 = bounds
+        self.tk_shapes[self.label_bg_tk_id] = Polygon(Point(x1, y1), Point(x2, y2))
+        self._label_visible: bool = True
+        self._label_factor: float = 1
 
     @property
     @abstractmethod
@@ -155,8 +172,17 @@ class ComponentShape(Generic[C], Shape, Observer):
         self.diagram.itemconfig(self.label_tk_id, text=text)
         self.update_label_pos()
 
+    def set_visible(self, visible: bool):
+        """Set the visibility state of all tkinter shapes connected to this shape, including the label."""
+        super().set_visible(visible)
+        self._label_visible = visible
+
     def set_label_visible(self, visible: bool):
-        """Change the state of visibilty of this shape's label."""
+        """Change the state of visibilty of this shape's label. The label and its background are only configured if the state changed, 
+        because the visibility of all labels is set again on every refresh of the diagram."""
+        if visible == self._label_visible:
+            return
+        self._label_visible = visible
         state = tk.NORMAL if visible else tk.HIDDEN
         self.diagram.itemconfig(self.label_tk_id, state=state)
         self.diagram.itemconfig(self.label_bg_tk_id, state=state)
@@ -166,12 +192,12 @@ class ComponentShape(Generic[C], Shape, Observer):
         label_pos = self.label_position
         self.tk_shapes[self.label_tk_id] = Polygon(label_pos)
         self.diagram.coords(self.label_tk_id, label_pos.x, label_pos.y)
-        self.diagram.update_idletasks()
-        if self.diagram.bbox(self.label_tk_id):
-            x1, x2, y1, y2 = self.diagram.bbox(self.label_tk_id)
-            self.tk_shapes[self.label_bg_tk_id] = Polygon(Point(x1, x2), Point(y1, y2))
+        bounds = self.diagram.bbox(self.label_tk_id) #the canvas updates the bounds of text immediately, no need to wait for idle tasks
+        if bounds:
+            x1, y1, x2, y2 = bounds
+            self.tk_shapes[self.label_bg_tk_id] = Polygon(Point(x1, y1), Point(x2, y2))
         else:
-            print(f"Warning: Label not found for {self.component.id}")
+            log.warning("Label not found for %s", self.component.id)
 
 
 class Tool:
@@ -248,6 +274,8 @@ class TwlDiagram(Observer, tk.Canvas):
 
     UI_PADDING: int = 10
 
+    BG_COLOR: str = "white"
+
     TEXT_TAG = "text"
     TEXT_BG_TAG = "text_bg"
     TEXT_SIZE = 10
@@ -257,16 +285,26 @@ class TwlDiagram(Observer, tk.Canvas):
 
     NO_UPDATE_TAGS = []
 
+    HIT_THRESHOLD: int = 64 #minimum number of shapes for which tkinter's item search is used to find shapes at a position
+    HIT_MARGIN: int = 6
+
+    RESERVED_TAGS: tuple[str, ...] = ("all", "current") #tags tkinter gives to shapes itself, they are searched for by checking the tags of every shape
+
     def __init__(self, master):
         """Create an instance of TwlDiagram."""
         tk.Canvas.__init__(self, master)
-        self.configure(background="white", highlightthickness=0)
+        self.configure(background=self.BG_COLOR, highlightthickness=0)
         self.grid(column=0, row=0, sticky=tk.NSEW)
         master.grid_rowconfigure(0, weight=1)
         master.grid_columnconfigure(0, weight=1)
 
         self.shapes: list[Shape] = []
-        self.selection: list[ComponentShape] = []
+        self.selection: dict[ComponentShape, None] = {} #dict instead of set to keep the selection order
+        self._shapes_by_tk_id: dict[int, Shape] | None = None #built on demand, reset on refresh and when a shape is removed
+        self._shapes_by_tk_id_count: int = 0
+        self._component_shapes: list[ComponentShape] | None = None #built on demand, reset on refresh and when a shape is removed
+        self._component_shapes_count: int = 0
+        self._shapes_by_component: tuple[list[ComponentShape], dict[Component, list[ComponentShape]]] = ([], {}) #index for the list returned by component_shapes
 
         self.current_zoom = tk.DoubleVar(value=100.0)
         self.current_zoom.trace_add("write", lambda *ignore: self.refresh())
@@ -298,20 +336,32 @@ class TwlDiagram(Observer, tk.Canvas):
     def refresh(self):
         """Configures diagram navigation and ui layout. Configures shape scale and visibility."""
         self.bottom_bar.place(x=self.UI_PADDING, y=self.winfo_height() - self.UI_PADDING, anchor=tk.SW)
-        [shape.scale(self.current_zoom.get() / 100) for shape in self.shapes]
+        scale = self.current_zoom.get() / 100
+        for shape in self.shapes:
+            shape.scale(scale)
+        self._shapes_by_tk_id = None
+        self._component_shapes = None
         self.update_scrollregion()
 
     def update_observer(self, component_id: str="", attribute_id: str=""):
         """Update the diagram. Performs refresh."""
         self.refresh()
 
+    def shapes_moved(self):
+        """Update the diagram after shapes were moved and redrawn, without refreshing all of the shapes."""
+        self.update_scrollregion()
+
     def clear(self):
         """Removes all shapes from the diagram."""
         for shape in self.find_all():
             tags = set(self.gettags(shape))
             if not tags.intersection(self.NO_UPDATE_TAGS):
                 self.delete(shape)
+        for shape in self.component_shapes:
+            shape.component.model.update_manager.unregister_observer(shape)
         self.shapes.clear()
+        self._shapes_by_tk_id = None
+        self._component_shapes = None
 
     def create_bottom_bar(self) -> tk.Frame:
         """Create frame on bottom of the diagram that holds zoom control."""
@@ -413,9 +463,10 @@ class TwlDiagram(Observer, tk.Canvas):
         button.pack()
 
     def select_tool(self, tool_id: int):
-        """Select the tool with the specified id."""
+        """Select the tool with the specified id. The tool is only changed here if the tool buttons didn't already change it."""
         self._selected_tool_id.set(tool_id)
-        self.handle_tool_change()
+        if self.selected_tool is not self.tools[tool_id]:
+            self.handle_tool_change()
 
     def handle_tool_change(self):
         """Perform tool change. Deactivate the previously selected tool and activate the new one."""
@@ -424,13 +475,15 @@ class TwlDiagram(Observer, tk.Canvas):
         self.selected_tool = self.tools[self._selected_tool_id.get()]
         self.selected_tool.activate()
 
-    def create_text_with_bg(self, *args, **kw) -> tuple[int, int]:
-        """Creates a label with a specific bg color to ensure readability. Used for ComponentShape labels."""
+    def create_text_with_bg(self, *args, **kw) -> tuple[int, int, tuple[int, int, int, int]]:
+        """Creates a label with a specific bg color to ensure readability. Used for ComponentShape labels. 
+        Returns the ids of the text and the background together with the bounds of the text. 
+        The background is created after the text and covers it, the labels are raised once after all shapes are drawn."""
         tags = kw.pop("tags", [])
         label_tag = kw.pop("label_tag", self.TEXT_TAG)
         bg_tag = kw.pop("bg_tag", self.TEXT_BG_TAG)
 
-        bg_color = kw.pop("bg_color", self["background"])
+        bg_color = kw.pop("bg_color", self.BG_COLOR) #constant instead of asking tkinter for the canvas background for every label
         kw.setdefault("anchor", tk.CENTER)
         kw.setdefault("font", ('Helvetica', self.TEXT_SIZE))
     
@@ -442,35 +495,72 @@ class TwlDiagram(Observer, tk.Canvas):
                                  width=0,
                                  fill=bg_color, 
                                  tags=[*tags, bg_tag])
-        self.tag_raise(bg_id)
-        self.tag_raise(text_id)
-        return text_id, bg_id
+        return text_id, bg_id, bounds
+
+    def raise_labels(self):
+        """Raise the label backgrounds and then the labels above all other shapes in the diagram."""
+        self.tag_raise(ComponentShape.LABEL_BG_TAG)
+        self.tag_raise(ComponentShape.LABEL_TAG)
 
     def label_visibility(self):
-        """Refresh the visibility of all ComponentShape labels."""
-        [shape.set_label_visible(self.label_visible(shape)) for shape in self.component_shapes]
+        """Refresh the visibility of all ComponentShape labels. The label settings are read once for all shapes."""
+        settings = self.label_settings()
+        for shape in self.component_shapes:
+            shape.set_label_visible(self.label_visible(shape, settings))
+
+    def label_settings(self) -> dict[type[Shape], bool]:
+        """Returns the label setting of this diagram for every shape type that has one. Default is no settings."""
+        return {}
 
-    def label_visible(self, shape: Shape) -> bool:
-        """Returns weather the label for the specified shape should be visible in the diagram. Default is False."""
+    def label_visible(self, shape: Shape, settings: dict[type[Shape], bool]) -> bool:
+        """Returns weather the label for the specified shape should be visible in the diagram with the label settings. Default is False."""
         return False
 
     @property
-    def component_shapes(self):
-        """Get all ComponentShapes from diagrams shapes."""
-        return [shape for shape in self.shapes if isinstance(shape, ComponentShape)]
+    def component_shapes(self) -> list[ComponentShape]:
+        """Get all ComponentShapes from diagrams shapes. The list is cached until shapes are added or removed and must not be modified."""
+        if self._component_shapes is None or self._component_shapes_count != len(self.shapes):
+            self._component_shapes = [shape for shape in self.shapes if isinstance(shape, ComponentShape)]
+            self._component_shapes_count = len(self.shapes)
+        return self._component_shapes
+
+    def shapes_near(self, x: float, y: float) -> list[Shape]:
+        """Returns the shapes that could be at the specified coordinate, in the order of the diagram's shapes. 
+        For diagrams with more shapes than the threshold the tkinter shapes around the coordinate are looked up with tkinter's find_overlapping, 
+        which uses the canvas's own spatial index, and mapped back to their shapes. Hidden shapes are always included, 
+        because find_overlapping ignores them, so the result is the same as checking all shapes."""
+        if len(self.shapes) < self.HIT_THRESHOLD:
+            return self.shapes
+        factor = self.current_zoom.get() / 100
+        margin = self.HIT_MARGIN * factor
+        near = set(self.shapes_overlapping(x * factor - margin, y * factor - margin, x * factor + margin, y * factor + margin))
+        return [shape for shape in self.shapes if shape in near or not shape.visible]
+
+    def shapes_overlapping(self, x1: float, y1: float, x2: float, y2: float) -> list[Shape]:
+        """Returns the shapes with visible tkinter shapes that overlap the rectangle in canvas coordinates, from the bottom to the top of the diagram.
+        The tkinter shapes are looked up with tkinter's find_overlapping and mapped back to their shapes."""
+        if self._shapes_by_tk_id is None or self._shapes_by_tk_id_count != len(self.shapes):
+            self._shapes_by_tk_id = {tk_id: shape for shape in self.shapes for tk_id in shape.tk_shapes.keys()}
+            self._shapes_by_tk_id_count = len(self.shapes)
+        shapes = (self._shapes_by_tk_id.get(tk_id) for tk_id in self.find_overlapping(x1, y1, x2, y2))
+        return list(dict.fromkeys(shape for shape in shapes if shape))
 
     def find_shape_at(self, x: float, y: float) -> Shape | None:
         """Returns shape in the diagram at the specified coordinate if it exists."""
-        return next(filter(lambda shape: shape.is_at(x, y), self.shapes), None)
+        return next(filter(lambda shape: shape.is_at(x, y), self.shapes_near(x, y)), None)
 
     S = TypeVar("S", bound=ComponentShape)
     def find_shape_of_list_at(self, shapes: list[S], x: float, y: float) -> S | None:
         """Returns shape that is included in the list in the diagram at the specified coordinate if it exists."""
+        candidates = self.shapes_near(x, y)
+        if candidates is not self.shapes:
+            included = set(shapes)
+            shapes = [shape for shape in candidates if shape in included]
         return next(filter(lambda shape: shape.is_at(x, y), shapes), None)
 
     def find_shape_of_type_at(self, component_type: Type[C], x: float, y: float) -> ComponentShape[C] | None:
         """Returns component shape of the specified type in the diagram at the specified coordinate if it exists."""
-        return next(filter(lambda shape: isinstance(shape.component, component_type) and shape.is_at(x, y), self.component_shapes), None)
+        return next(filter(lambda shape: isinstance(shape, ComponentShape) and isinstance(shape.component, component_type) and shape.is_at(x, y), self.shapes_near(x, y)), None)
 
     def find_component_of_type_at(self, component_type: Type[C], x: float, y: float) -> C | None:
         """Returns a component of the specified type in the diagram that is at the specified coordinate if it exists."""
@@ -478,8 +568,16 @@ class TwlDiagram(Observer, tk.Canvas):
         return shape.component if shape else None
 
     def shapes_for(self, component: C) -> list[ComponentShape[C]]:
-        """Returns all ComponentShapes in the diagram for the component."""
-        return [shape for shape in self.component_shapes if shape.component == component]
+        """Returns all ComponentShapes in the diagram for the component. 
+        The shapes are looked up in an index of the ComponentShapes, which is only built again when the ComponentShapes changed."""
+        component_shapes, shapes_by_component = self._shapes_by_component
+        if component_shapes is not self.component_shapes:
+            component_shapes = self.component_shapes
+            shapes_by_component = {}
+            for shape in component_shapes:
+                shapes_by_component.setdefault(shape.component, []).append(shape)
+            self._shapes_by_component = component_shapes, shapes_by_component
+        return list(shapes_by_component.get(component, ()))
 
     S = TypeVar('S', bound=Shape)
     def shapes_of_type_for(self, shape_type: Type[S], component: Component) -> list[S]:
@@ -487,26 +585,37 @@ class TwlDiagram(Observer, tk.Canvas):
         return [shape for shape in self.shapes_for(component) if isinstance(shape, shape_type)]
 
     def find_withtag(self, tagOrId: str | int) -> tuple[int, ...]:
-        """Returns tkinter shape ids for all shapes in the diagram that have this tag."""
-        return tuple(filter(lambda id: (id == tagOrId) or (tagOrId in self.gettags(id)), self.find_all()))
+        """Returns tkinter shape ids for all shapes in the diagram that have this tag. Uses the search built into tkinter, 
+        except for tags tkinter would interpret as an id, a tag expression or one of its reserved tags, for example ids of Components renamed by the user."""
+        if isinstance(tagOrId, str) and (tagOrId.isdigit() or not tagOrId.isidentifier() or tagOrId in self.RESERVED_TAGS):
+            return tuple(filter(lambda id: tagOrId in self.gettags(id), self.find_all()))
+        return super().find_withtag(tagOrId)
 
     def find_withtags(self, *tags: str) -> int | None:
-        """Returns tkinter shape ids for all shapes in the diagram that have all of these tags."""
-        return next((id for id in self.find_all() if set(tags).issubset(set(self.gettags(id)))), None)
+        """Returns tkinter shape ids for all shapes in the diagram that have all of these tags.
+        Only the shapes found with the first tag are checked for the other tags."""
+        if not tags:
+            return None
+        other_tags = set(tags[1:])
+        return next((id for id in self.find_withtag(tags[0]) if other_tags.issubset(self.gettags(id))), None)
 
     def find_except_withtags(self, *tagOrIds: str | int) -> tuple[int, ...]:
-        """Returns tkinter shape ids for all shapes in the diagram that don't have any of these tags."""
-        return tuple([id for id in self.find_all() if all(id != tagOrId and tagOrId not in self.gettags(id) for tagOrId in tagOrIds)])
+        """Returns tkinter shape ids for all shapes in the diagram that don't have any of these tags.
+        The shapes to exclude are found with one search per tag instead of checking the tags of every shape."""
+        excluded = {id for tagOrId in tagOrIds for id in self.find_withtag(tagOrId)}
+        return tuple(id for id in self.find_all() if id not in excluded)
 
     def tag_lower(self, lower: str | int, upper: str | int | None = None) -> None:
         """Lower all shapes with lower tag under shapes with upper tag if specified, otherwise under all shapes.
         This method doesn't raise exception if there are no shapes with this tag in the diagram, unlike tkinter build-in method."""
-        if self.find_withtag(lower) and (not upper or self.find_withtag(upper)):
+        try:
             super().tag_lower(lower, upper)
+        except tk.TclError:
+            pass #no shapes with the upper tag
 
     def delete_temp_shapes(self):
         """Delete all temporary shapes in the diagram. Temporary shapes are identified with temp tag."""
-        [self.delete(shape) for shape in self.find_withtag(ComponentShape.TEMP)]
+        self.delete(ComponentShape.TEMP)
 
     def process_entry(self, entry: ttk.Entry, min: float, max: float, variable: tk.DoubleVar):
         """Process the value of an entry in the diagrams bottom bar. Check if the value is valid and within the specified min and max."""
@@ -1,5 +1,9 @@
+from functools import lru_cache
+
+
+@lru_cache(maxsize=4096)
 def int_to_roman(num: int) -> str:
-    """Return the roman numeral equivalent of num."""
+    """Return the roman numeral equivalent of num. Results are cached, because generating a unique id converts every number up to the next free one."""
     val = [
         1000, 900, 500, 400,
         100, 90, 50, 40,
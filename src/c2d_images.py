@@ -6,6 +6,7 @@ from typing import cast
 
 
 image_references: list[tk.PhotoImage] = []
+png_images: dict[tuple[str, int|None, int|None], tk.PhotoImage] = {}
 
 def add_image(pil_image: Image.Image, width: int|None=None, height: int|None=None) -> tk.PhotoImage:
     """Add an image to the application. Resizes it to the specified width and height and stores a reference to keep it in memory."""
@@ -16,9 +17,13 @@ def add_image(pil_image: Image.Image, width: int|None=None, height: int|None=Non
     return tk_image
 
 def add_png_by_name(name: str, width: int|None=None, height: int|None=None) -> tk.PhotoImage:
-    """Add a png by specifying it's name. The image is looked up in the img folder."""
-    pil_image = Image.open(get_image_path(name, "png"))
-    return add_image(pil_image, width, height)
+    """Add a png by specifying it's name. The image is looked up in the img folder. 
+    Images are only loaded and resized once for each name and size, after that the same image is returned again."""
+    key = (name, width, height)
+    if key not in png_images:
+        pil_image = Image.open(get_image_path(name, "png"))
+        png_images[key] = add_image(pil_image, width, height)
+    return png_images[key]
 
 def get_image_path(image_name: str, image_type: str):
     """Get absolute path to image, works for dev and for PyInstaller."""
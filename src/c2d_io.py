@@ -1,10 +1,19 @@
 from tkinter import filedialog, messagebox
 import json
+import logging
+from operator import attrgetter
 import os
 
 from c2d_app import TwlApp
 from c2d_components import Node, Beam, Support, Force
 
+log = logging.getLogger(__name__)
+
+#getters for the serialized values of each Component type, the attributes are looked up in C instead of Python bytecode
+NODE_VALUES = attrgetter("id", "x", "y")
+BEAM_VALUES = attrgetter("id", "start_node.id", "end_node.id")
+SUPPORT_VALUES = attrgetter("id", "node.id", "angle", "constraints")
+FORCE_VALUES = attrgetter("id", "node.id", "angle", "strength")
 
 FILE_PATH: str | None = None
 EXTENSION: str = ".c2d"
@@ -22,17 +31,17 @@ def new_project():
             return
     TwlApp.model().clear()
     FILE_PATH = None
-    print("Project cleared")
+    log.info("Project cleared")
     TwlApp.saved_state().set(True)
 
 def save_project():
     """Serialize the project and save it to the stored project path. If no path is stored ask the user to provide one."""
     global FILE_PATH
     if FILE_PATH:
+        serialized_project = json.dumps(serialize_project()) #encoded in one piece, json.dump writes to the file in many small chunks
         with open(FILE_PATH, "w") as file:
-            serialized_project = serialize_project()
-            json.dump(serialized_project, file)
-            print("Project saved to", FILE_PATH)
+            file.write(serialized_project)
+        log.info("Project saved to %s", FILE_PATH)
         TwlApp.saved_state().set(True)
         return
     save_project_as()
@@ -58,10 +67,9 @@ def open_project(file_path=None) -> bool:
         FILE_PATH = file_path
         with open(FILE_PATH, "r") as file:
             serialized_project = json.load(file)
-            TwlApp.update_manager().pause_observing()
+        with TwlApp.update_manager().paused():
             deserialize_project(serialized_project)
-            TwlApp.update_manager().resume_observing()
-        print("Project loaded from", FILE_PATH)
+        log.info("Project loaded from %s", FILE_PATH)
         TwlApp.saved_state().set(True)
         return True
     return False
@@ -69,10 +77,10 @@ def open_project(file_path=None) -> bool:
 def serialize_project():
     """Project is converted to a dict in preparation to be stored in a json file."""
     serialized_project = {
-        "nodes": [(node.id, node.x, node.y) for node in TwlApp.model().nodes],
-        "beams": [(beam.id, beam.start_node.id, beam.end_node.id) for beam in TwlApp.model().beams],
-        "supports": [(support.id, support.node.id, support.angle, support.constraints) for support in TwlApp.model().supports],
-        "forces": [(force.id, force.node.id, force.angle, force.strength) for force in TwlApp.model().forces]
+        "nodes": list(map(NODE_VALUES, TwlApp.model().nodes)),
+        "beams": list(map(BEAM_VALUES, TwlApp.model().beams)),
+        "supports": list(map(SUPPORT_VALUES, TwlApp.model().supports)),
+        "forces": list(map(FORCE_VALUES, TwlApp.model().forces))
     }
     return serialized_project
 
@@ -81,26 +89,13 @@ def deserialize_project(serialized_project):
     model = TwlApp.model()
     model.clear()
 
-    for id, x, y in serialized_project["nodes"]:
-        node = Node(model, x, y, id)
-        model.nodes.append(node)
-
-    for id, start_node_id, end_node_id in serialized_project["beams"]:
-        start_node = model.nodes.component_for_id(start_node_id)
-        end_node = model.nodes.component_for_id(end_node_id)
-        assert(start_node)
-        assert(end_node)
-        beam = Beam(model, start_node, end_node, id)
-        model.beams.append(beam)
-
-    for id, node_id, angle, constraints in serialized_project["supports"]:
-        node = model.nodes.component_for_id(node_id)
-        assert(node)
-        support = Support(model, node, angle, constraints, id)
-        model.supports.append(support)
+    nodes = [Node(model, x, y, id) for id, x, y in serialized_project["nodes"]]
+    model.nodes.append(*nodes)
+    node_by_id = {node.id: node for node in nodes} #lookup table instead of searching the Nodes for every Beam, Support and Force
 
-    for id, node_id, angle, strength in serialized_project["forces"]:
-        node = model.nodes.component_for_id(node_id)
-        assert(node)
-        force = Force(model, node, angle, strength, id)
-        model.forces.append(force)
\ No newline at end of file
+    model.beams.append(*(Beam(model, node_by_id[start_node_id], node_by_id[end_node_id], id) 
+                         for id, start_node_id, end_node_id in serialized_project["beams"]))
+    model.supports.append(*(Support(model, node_by_id[node_id], angle, constraints, id) 
+                            for id, node_id, angle, constraints in serialized_project["supports"]))
+    model.forces.append(*(Force(model, node_by_id[node_id], angle, strength, id) 
+                          for id, node_id, angle, strength in serialized_project["forces"]))
\ No newline at end of file
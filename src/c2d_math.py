@@ -16,9 +16,37 @@ class Direction(Enum):
     COLINEAR = "col"
 
 
+#cosine and sine of the right angles, rotations by these angles don't need trigonometric functions and have no rounding errors
+RIGHT_ANGLE_ROTATIONS: dict[float, tuple[float, float]] = {0: (1.0, 0.0), 90: (0.0, 1.0), 180: (-1.0, 0.0), 270: (0.0, -1.0)}
+
+#tangent of half the 45 degree snapping step, separates the straight from the diagonal directions in Line.angle_rounded
+TAN_22_5: float = math.tan(math.radians(22.5))
+
+
+def segment_distance_squared(x: float, y: float, start_x: float, start_y: float, end_x: float, end_y: float) -> float:
+    """Return the squared shortest distance between the point (x, y) and the line segment from start to end. 
+    Works on plain floats, so hit tests don't need to create Points and Lines."""
+    p_x = end_x - start_x
+    p_y = end_y - start_y
+    norm = p_x * p_x + p_y * p_y
+
+    u =  ((x - start_x) * p_x + (y - start_y) * p_y) / norm
+    if u < 0:
+        u = 0
+    elif u > 1:
+        u = 1
+
+    dx = x - (start_x + u * p_x)
+    dy = y - (start_y + u * p_y)
+
+    return dx*dx + dy*dy
+
+
 class Point:
     """Stores xy coordinate as two float values."""
 
+    __slots__ = ("x", "y") #Points are created for every shape and position calculation, slots make them smaller and faster to access
+
     def __init__(self, x: float, y: float):
         """Create an instance of Point."""
         self.x: float = x
@@ -26,20 +54,7 @@ class Point:
 
     def rotate(self, center_of_rotation: 'Point', angle: float):
         """Rotate the Point around a specified center of rotation."""
-        angle %= 360
-        angle = math.radians(angle)
-
-        #Translate the Point to be rotated so that the center of rotation becomes the origin
-        translated_x = self.x - center_of_rotation.x
-        translated_y = self.y - center_of_rotation.y
-        
-        #Rotate the translated Point around the origin by the specified angle
-        rotated_x = translated_x * math.cos(angle) - translated_y * math.sin(angle)
-        rotated_y = translated_x * math.sin(angle) + translated_y * math.cos(angle)
-        
-        #Translate the rotated Point back to its original position
-        self.x = rotated_x + center_of_rotation.x
-        self.y = rotated_y + center_of_rotation.y
+        Rotation(angle).rotate_point(self, center_of_rotation)
 
     def move(self, x: float, y: float):
         """Move the Point by the specified amount in x and y direction."""
@@ -56,7 +71,7 @@ class Point:
 
     def distance_to_point(self, point: 'Point') -> float:
         """Returns the distance of between this Point and the specified Point."""
-        return ((self.x - point.x) ** 2 + (self.y - point.y) ** 2) ** 0.5
+        return math.hypot(self.x - point.x, self.y - point.y)
 
     def distance_to_point_scaled(self, point: 'Point') -> float:
         """Return the distance between this point and the specified Point, scaled by a factor of 0.01."""
@@ -64,16 +79,11 @@ class Point:
 
     def distance_to_line(self, line: 'Line') -> float:
         """Return the shortest distance between this Point and the Line."""
-        p = line.end.subtract(line.start)
-        norm = p.dot_product(p)
+        return self.distance_to_line_squared(line)**.5
 
-        u =  ((self.x - line.start.x) * p.x + (self.y - line.start.y) * p.y) / norm
-        u = max(min(1, u), 0)
-
-        dx = self.x - (line.start.x + u * p.x)
-        dy = self.y - (line.start.y + u * p.y)
-
-        return (dx*dx + dy*dy)**.5
+    def distance_to_line_squared(self, line: 'Line') -> float:
+        """Return the squared shortest distance between this Point and the Line. Cheaper than distance_to_line for comparisons."""
+        return segment_distance_squared(self.x, self.y, line.start.x, line.start.y, line.end.x, line.end.y)
 
     def distance_to_line_scaled(self, line: 'Line') -> float:
         """Return the shortest distance between this Point and the Line scaled by a factor of 0.01."""
@@ -98,6 +108,8 @@ class Point:
 class Line:
     """Line defined by two Points start and end."""
 
+    __slots__ = ("start", "end")
+
     def __init__(self, start: Point, end: Point) -> None:
         """Create an instance of Line."""
         self.start: Point = start
@@ -105,9 +117,7 @@ class Line:
 
     def length(self) -> float:
         """Returns the length of this Line."""
-        p = self.end.subtract(self.start)
-        distance_squared = p.x**2 + p.y**2
-        return math.sqrt(distance_squared)
+        return math.hypot(self.end.x - self.start.x, self.end.y - self.start.y)
 
     def length_scaled(self) -> float:
         """Returns the length of this Line scaled by a factor of 0.01."""
@@ -115,22 +125,35 @@ class Line:
 
     def set_length(self, length):
         """Set the length of this Line by keeping the start Point and direction and moving the end Point."""
-        direction = self.end.subtract(self.start)
-        ux = direction.x / self.length()
-        uy = direction.y / self.length()
+        dx = self.end.x - self.start.x
+        dy = self.end.y - self.start.y
+        current_length = math.hypot(dx, dy)
+        ux = dx / current_length
+        uy = dy / current_length
         self.end.x = self.start.x + (ux * length * 100)
         self.end.y = self.start.y + (uy * length * 100)
 
     def angle(self) -> float:
         """Returns the angle of this Line in degrees."""
-        d = self.end.subtract(self.start)
-        angle_degrees = 90 - math.degrees(math.atan2(-d.y, d.x))
+        angle_degrees = 90 - math.degrees(math.atan2(self.start.y - self.end.y, self.end.x - self.start.x))
         angle_degrees %= 360
         return angle_degrees
 
     def angle_rounded(self) -> float:
-        """Returns the angle of this Line in degrees rounded in steps of 45."""
-        return (round((self.angle() + 22.5) // 45) * 45) % 360
+        """Returns the angle of this Line in degrees rounded in steps of 45. 
+        The direction is classified by comparing the coordinate differences, so no trigonometric functions are needed."""
+        dx = self.end.x - self.start.x
+        dy = self.start.y - self.end.y
+        if dx == 0 and dy == 0:
+            return 90
+        abs_x, abs_y = abs(dx), abs(dy)
+        if abs_x < abs_y * TAN_22_5:
+            return 0 if dy > 0 else 180
+        if abs_y < abs_x * TAN_22_5:
+            return 90 if dx > 0 else 270
+        if dx > 0:
+            return 45 if dy > 0 else 135
+        return 315 if dy > 0 else 225
 
     def distance(self, point: Point) -> float:
         """Returns the shortest distance between this Line and the specified Point."""
@@ -141,8 +164,9 @@ class Line:
         return point.distance_to_line_scaled(self)
 
     def rotate(self, center_of_rotation: Point, angle: float):
-        """Rotate this Line around the specified center of rotation by rotating it's start and end Points."""
-        [p.rotate(center_of_rotation, angle) for p in [self.start, self.end]]
+        """Rotate this Line around the specified center of rotation by rotating it's start and end Points. Sine and cosine are calculated once for both Points."""
+        rotation = Rotation(angle)
+        for p in (self.start, self.end): rotation.rotate_point(p, center_of_rotation)
 
     def move(self, x: float, y: float):
         """Move this Line by the specified amount in x and y direction by moving it's start and end Points."""
@@ -241,6 +265,8 @@ class Line:
 class Triangle:
     """Triangle defined by three Points p1, p2 and p3."""
 
+    __slots__ = ("p1", "p2", "p3")
+
     def __init__(self, p1: Point, p2: Point, p3: Point) -> None:
         """Create an instance of Triangle."""
         self.p1: Point = p1
@@ -248,8 +274,9 @@ class Triangle:
         self.p3: Point = p3
 
     def rotate(self, center_of_rotation: Point, angle: float):
-        """Rotate the Triangle by rotating all of it's Points."""
-        [p.rotate(center_of_rotation, angle) for p in [self.p1, self.p2, self.p3]]
+        """Rotate the Triangle by rotating all of it's Points. Sine and cosine are calculated once for all Points."""
+        rotation = Rotation(angle)
+        for p in (self.p1, self.p2, self.p3): rotation.rotate_point(p, center_of_rotation)
 
     def scale(self, factor):
         """Scale the Triangle by scaling all of it's Points."""
@@ -259,15 +286,17 @@ class Triangle:
 
     def barycentric_coordinates(self, point: Point) -> tuple[float, float, float]:
         """Returns the barycentric coordinates of the specified Point in this Triangle."""
-        v0 = self.p2.subtract(self.p1)
-        v1 = self.p3.subtract(self.p1)
-        v2 = point.subtract(self.p1)
-
-        dot00 = v0.dot_product(v0)
-        dot01 = v0.dot_product(v1)
-        dot02 = v0.dot_product(v2)
-        dot11 = v1.dot_product(v1)
-        dot12 = v1.dot_product(v2)
+        #plain floats instead of intermediate Points, this is called for every hit test
+        x1, y1 = self.p1.x, self.p1.y
+        v0_x, v0_y = self.p2.x - x1, self.p2.y - y1
+        v1_x, v1_y = self.p3.x - x1, self.p3.y - y1
+        v2_x, v2_y = point.x - x1, point.y - y1
+
+        dot00 = v0_x * v0_x + v0_y * v0_y
+        dot01 = v0_x * v1_x + v0_y * v1_y
+        dot02 = v0_x * v2_x + v0_y * v2_y
+        dot11 = v1_x * v1_x + v1_y * v1_y
+        dot12 = v1_x * v2_x + v1_y * v2_y
 
         inv_denom = 1 / (dot00 * dot11 - dot01 * dot01)
         u = (dot11 * dot02 - dot01 * dot12) * inv_denom
@@ -276,6 +305,14 @@ class Triangle:
 
         return (u, v, w)
 
+    def edge_functions(self) -> tuple[float, float, float, float, float, float, float, float, float]:
+        """Returns the coefficients a, b, c of the edge functions a * x + b * y + c for the sides p1-p2, p2-p3 and p3-p1 of this Triangle. 
+        A point is inside the Triangle if the edge functions all have the same sign or are zero."""
+        p1, p2, p3 = self.p1, self.p2, self.p3
+        return (p1.y - p2.y, p2.x - p1.x, p1.x * p2.y - p2.x * p1.y,
+                p2.y - p3.y, p3.x - p2.x, p2.x * p3.y - p3.x * p2.y,
+                p3.y - p1.y, p1.x - p3.x, p3.x * p1.y - p1.x * p3.y)
+
     def inside_triangle(self, point: Point) -> bool:
         """Returns True if the point is inside the triangle, False otherwise."""
         bc = self.barycentric_coordinates(point)
@@ -285,6 +322,8 @@ class Triangle:
 class Polygon:
     """Polygon defined by a list of Points."""
 
+    __slots__ = ("points",)
+
     def __init__(self, *points: Point) -> None:
         """Create an instance of Polygon."""
         self.points: list[Point] = list(points)
@@ -295,8 +334,11 @@ class Polygon:
         return cls(*point_list)
 
     def in_bounds(self, p1: Point, p2: Point) -> bool:
-        """Returns True if all Points of the Polygon are within the bounds of the rectangle defined by the specified Points."""
-        return all(point.in_bounds(p1, p2) for point in self.points)
+        """Returns True if all Points of the Polygon are within the bounds of the rectangle defined by the specified Points. 
+        The bounds are calculated once for all Points."""
+        min_x, max_x = (p1.x, p2.x) if p1.x <= p2.x else (p2.x, p1.x)
+        min_y, max_y = (p1.y, p2.y) if p1.y <= p2.y else (p2.y, p1.y)
+        return all(min_x <= point.x <= max_x and min_y <= point.y <= max_y for point in self.points)
 
     def move(self, x: float, y: float):
         """Move the Polygon by the specified amount in x and y direction by moving all of it's Points."""
@@ -307,4 +349,41 @@ class Polygon:
         """Returns the midpoint of this Polygon, calculated as the average position of all it's Points."""
         x = sum(point.x for point in self.points) / len(self.points)
         y = sum(point.y for point in self.points) / len(self.points)
-        return Point(x, y)
\ No newline at end of file
+        return Point(x, y)
+
+class Rotation:
+    """Rotation by a fixed angle in degrees. Sine and cosine are calculated once, so rotating Points only takes multiplications and additions."""
+
+    __slots__ = ("angle", "cos", "sin")
+
+    def __init__(self, angle: float) -> None:
+        """Create an instance of Rotation."""
+        self.angle: float = angle
+        angle %= 360
+        if angle in RIGHT_ANGLE_ROTATIONS:
+            self.cos, self.sin = RIGHT_ANGLE_ROTATIONS[angle]
+        else:
+            radians = math.radians(angle)
+            self.cos: float = math.cos(radians)
+            self.sin: float = math.sin(radians)
+
+    def rotate(self, center_of_rotation: Point, x: float, y: float) -> Point:
+        """Returns a new Point at the specified coordinates rotated around the center of rotation. Same result as Point.rotate."""
+        translated_x = x - center_of_rotation.x
+        translated_y = y - center_of_rotation.y
+        return Point(translated_x * self.cos - translated_y * self.sin + center_of_rotation.x,
+                     translated_x * self.sin + translated_y * self.cos + center_of_rotation.y)
+
+    def rotate_point(self, point: Point, center_of_rotation: Point):
+        """Rotate the Point around the center of rotation by changing its coordinates."""
+        translated_x = point.x - center_of_rotation.x
+        translated_y = point.y - center_of_rotation.y
+        point.x = translated_x * self.cos - translated_y * self.sin + center_of_rotation.x
+        point.y = translated_x * self.sin + translated_y * self.cos + center_of_rotation.y
+
+    def rotate_offset(self, center_of_rotation: Point, offset: tuple[float, float]) -> Point:
+        """Returns a new Point at the offset from the center of rotation, rotated around it. 
+        Used for shapes whose unrotated points are constant offsets from their Node."""
+        dx, dy = offset
+        return Point(dx * self.cos - dy * self.sin + center_of_rotation.x,
+                     dx * self.sin + dy * self.cos + center_of_rotation.y)
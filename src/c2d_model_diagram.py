@@ -1,9 +1,12 @@
 import tkinter as tk
+from typing import Type, TypeVar, Generic, Callable
+
+import numpy as np
 
 from c2d_app import TwlApp
-from c2d_math import Point, Line, Triangle, Polygon
+from c2d_math import Point, Line, Triangle, Polygon, Rotation, segment_distance_squared
 from c2d_components import AngleAttribute, ConstraintsAttribute, EndNodeAttribute, Node, Beam, NodeAttribute, StartNodeAttribute, Support, Force, XCoordinateAttribute, YCoordinateAttribute
-from c2d_diagram import Shape, ComponentShape, TwlDiagram
+from c2d_diagram import Shape, ComponentShape, TwlDiagram, C
 
 
 class NodeShape(ComponentShape[Node]):
@@ -12,8 +15,11 @@ class NodeShape(ComponentShape[Node]):
     TAG: str = "node"
 
     RADIUS: int = 6
+    RADIUS_SQUARED: int = RADIUS * RADIUS
     BORDER: int = 2
 
+    CIRCLE_TAG: str = "node_circle"
+
     LABEL_OFFSET = 15
 
     def __init__(self, node: Node, diagram: 'ModelDiagram') -> None:
@@ -28,7 +34,7 @@ class NodeShape(ComponentShape[Node]):
                             fill=self.BG_COLOR, 
                             outline=self.COLOR, 
                             width = self.BORDER, 
-                            tags=[*self.TAGS, str(self.component.id)])
+                            tags=[*self.TAGS, str(self.component.id), self.CIRCLE_TAG])
         self.tk_shapes[self.circle_tk_id] = Polygon(p1, p2)
 
     @property
@@ -38,7 +44,10 @@ class NodeShape(ComponentShape[Node]):
 
     def is_at(self, x: float, y: float) -> bool:
         """Returns True if the shape is at the specified position in the diagram, False otherwise."""
-        return True if abs(self.component.x - x) <= self.RADIUS and abs(self.component.y - y) <= self.RADIUS else False
+        node = self.component
+        dx = node.x - x
+        dy = node.y - y
+        return dx*dx + dy*dy <= self.RADIUS_SQUARED
 
     def default_style(self, *tags: str) -> dict[str, str]:
         """Get default, unselected style. Node is filled white with black outline."""
@@ -61,21 +70,23 @@ class NodeShape(ComponentShape[Node]):
     def update_observer(self, component_id: str = "", attribute_id: str = ""):
         """Update the position of this shape in the diagram if the Node's position changed. Also notifies shapes connected to Node to move."""
         if component_id == self.component.id and attribute_id in (XCoordinateAttribute.ID, YCoordinateAttribute.ID):
-            p1, p2 = self.circle_coords
-            self.tk_shapes[self.circle_tk_id] = Polygon(p1, p2)
-            self.update_label_pos()
+            self.update_position()
             for beam in self.component.beams:
-                beam_shape = self.diagram.shapes_of_type_for(BeamShape, beam)[0]
-                beam_shape.update_observer(beam.id, StartNodeAttribute.ID if beam.start_node == self.component else EndNodeAttribute.ID)
+                self.diagram.shapes_of_type_for(BeamShape, beam)[0].update_position()
             for support in self.component.supports:
-                support_shape = self.diagram.shapes_of_type_for(SupportShape, support)[0]
-                support_shape.update_observer(support.id, NodeAttribute.ID)
+                self.diagram.shapes_of_type_for(SupportShape, support)[0].update_position()
             for force in self.component.forces:
-                force_shape = self.diagram.shapes_of_type_for(ForceShape, force)[0]
-                force_shape.update_observer(force.id, NodeAttribute.ID)
-            self.diagram.refresh()
+                self.diagram.shapes_of_type_for(ForceShape, force)[0].update_position()
+            self.diagram.shapes_moved()
         super().update_observer(component_id, attribute_id)
 
+    def update_position(self):
+        """Move the circle and label to the Node's position. Only the tkinter shapes of this shape are changed."""
+        p1, p2 = self.circle_coords
+        self.tk_shapes[self.circle_tk_id] = Polygon(p1, p2)
+        self.update_label_pos()
+        self.redraw()
+
 
 class BeamShape(ComponentShape[Beam]):
     """Shape that represents Beam Component in the diagram. Drawn as a line connecting two Nodes."""
@@ -87,9 +98,6 @@ class BeamShape(ComponentShape[Beam]):
         """Create an instance of BeamShape."""
         super().__init__(beam, diagram)
         self.draw_line()
-        diagram.tag_lower(BeamShape.TAG, NodeShape.TAG)
-        diagram.tag_lower(BeamShape.TAG, SupportShape.TAG)
-        diagram.tag_lower(BeamShape.TAG, ForceShape.TAG)
 
     def draw_line(self):
         """Draw the line that represents the Beam in the diagram and store it's position and tkinter id."""
@@ -107,8 +115,15 @@ class BeamShape(ComponentShape[Beam]):
         return Line(Point(self.component.start_node.x, self.component.start_node.y), Point(self.component.end_node.x, self.component.end_node.y))
 
     def is_at(self, x: float, y: float) -> bool:
-        """Returns True if the shape is at the specified position in the diagram, False otherwise."""
-        return Point(x, y).distance_to_line(self.line_coords) < self.WIDTH/2
+        """Returns True if the shape is at the specified position in the diagram, False otherwise. 
+        Positions outside of the Beam's bounding box extended by half the line width are rejected before calculating the distance."""
+        start, end = self.component.start_node, self.component.end_node
+        start_x, start_y, end_x, end_y = start.x, start.y, end.x, end.y
+        margin = self.WIDTH / 2
+        if (x < min(start_x, end_x) - margin or x > max(start_x, end_x) + margin
+                or y < min(start_y, end_y) - margin or y > max(start_y, end_y) + margin):
+            return False
+        return segment_distance_squared(x, y, start_x, start_y, end_x, end_y) < margin * margin
 
     def default_style(self, *tags: str) -> dict[str, str]:
         """Get default, unselected style. Beam line is black."""
@@ -131,12 +146,45 @@ class BeamShape(ComponentShape[Beam]):
     def update_observer(self, component_id: str = "", attribute_id: str = ""):
         """Update line position if start or end Node changed."""
         if component_id == self.component.id and attribute_id in (StartNodeAttribute.ID, EndNodeAttribute.ID):
-            line = self.line_coords
-            self.tk_shapes[self.line_tk_id] = Polygon(line.start, line.end)
-            self.update_label_pos()
-            self.diagram.refresh()
+            self.update_position()
+            self.diagram.shapes_moved()
         super().update_observer(component_id, attribute_id)
 
+    def update_position(self):
+        """Move the line and label to the position of the Beam's Nodes. Only the tkinter shapes of this shape are changed."""
+        line = self.line_coords
+        self.tk_shapes[self.line_tk_id] = Polygon(line.start, line.end)
+        self.update_label_pos()
+        self.redraw()
+
+
+G = TypeVar('G')
+
+class RotatedGeometry(Generic[G]):
+    """Caches the rotation of a shape around its Node and the geometry the shape uses for hit tests. 
+    The rotation is only calculated again when the angle changed, the geometry when the Node's position or the angle changed."""
+
+    def __init__(self, calculate: Callable[[], G]) -> None:
+        """Create an instance of RotatedGeometry that calculates the geometry with the specified function."""
+        self.calculate: Callable[[], G] = calculate
+        self._rotation: Rotation | None = None
+        self._geometry: G | None = None
+        self._key: tuple[float, float, float] | None = None
+
+    def rotation(self, angle: float) -> Rotation:
+        """Get the rotation for the angle."""
+        if self._rotation is None or self._rotation.angle != angle:
+            self._rotation = Rotation(angle)
+        return self._rotation
+
+    def geometry(self, node: Node, angle: float) -> G:
+        """Get the geometry for the position of the Node and the angle."""
+        key = (node.x, node.y, angle)
+        if self._key != key:
+            self._geometry = self.calculate()
+            self._key = key
+        return self._geometry
+
 
 class SupportShape(ComponentShape[Support]):
     """Shape that represents Support component in the diagram. Drawn as Triangle connected to a Node."""
@@ -151,18 +199,30 @@ class SupportShape(ComponentShape[Support]):
     LINE_SPACING: int = 5
 
     LABEL_OFFSET = 20
+    LABEL_POSITION: tuple[float, float] = (0, HEIGHT + LABEL_OFFSET) #offset of the label from the Node before rotation
 
     def __init__(self, support: Support, diagram: 'ModelDiagram') -> None:
         """Create an instance of SupportShape."""
+        self.cache: RotatedGeometry[tuple[float, float, float, float, float, float, float, float, float]] = RotatedGeometry(lambda: self.triangle_coords.edge_functions())
         super().__init__(support, diagram)
         self.draw_triangle()
         self.draw_line()
         self.update_line_visibility()
-        diagram.tag_lower(SupportShape.TAG, NodeShape.TAG)
 
     def is_at(self, x: float, y: float) -> bool:
-        """Returns True if the shape is at the specified position in the diagram, False otherwise."""
-        return self.triangle_coords.inside_triangle(Point(x, y))
+        """Returns True if the shape is at the specified position in the diagram, False otherwise. 
+        Evaluates the edge functions of the cached triangle, which only takes a few multiplications per test."""
+        a1, b1, c1, a2, b2, c2, a3, b3, c3 = self.hit_edges
+        s1 = a1 * x + b1 * y + c1
+        s2 = a2 * x + b2 * y + c2
+        s3 = a3 * x + b3 * y + c3
+        return (s1 >= 0 and s2 >= 0 and s3 >= 0) or (s1 <= 0 and s2 <= 0 and s3 <= 0)
+
+    @property
+    def hit_edges(self) -> tuple[float, float, float, float, float, float, float, float, float]:
+        """Get the edge functions of the triangle used to check if the shape is at a position. They are cached, because they're needed for every hit test, 
+        and only calculated again when the Node's position or the angle of the Support changed."""
+        return self.cache.geometry(self.component.node, self.component.angle)
 
     def draw_triangle(self):
         """Draw the triangle that represents the Support in the diagram and store it's position and tkinter id."""
@@ -179,15 +239,19 @@ class SupportShape(ComponentShape[Support]):
                                tags=[*self.TAGS, str(self.component.id)])
         self.tk_shapes[self.triangle_tk_id] = Polygon(triangle.p1, triangle.p2, triangle.p3)
 
+    @property
+    def rotation(self) -> Rotation:
+        """Get the rotation of the shape around its Node. Sine and cosine are only calculated again when the angle of the Support changed."""
+        return self.cache.rotation(self.component.angle + 180)
+
     @property
     def triangle_coords(self) -> Triangle:
         """Get the coordinates of the triangle that represents the Support in the diagram."""
         n_point = Point(self.component.node.x, self.component.node.y)
-        l_point = Point(int(n_point.x - self.WIDTH / 2), n_point.y + self.HEIGHT)
-        r_point = Point(int(n_point.x + self.WIDTH / 2), n_point.y + self.HEIGHT)
-        triangle = Triangle(n_point, l_point, r_point)
-        triangle.rotate(n_point, self.component.angle + 180)
-        return triangle
+        rotation = self.rotation
+        l_point = rotation.rotate(n_point, int(n_point.x - self.WIDTH / 2), n_point.y + self.HEIGHT)
+        r_point = rotation.rotate(n_point, int(n_point.x + self.WIDTH / 2), n_point.y + self.HEIGHT)
+        return Triangle(n_point, l_point, r_point)
 
     def draw_line(self):
         """Draw the line below the triangle for Supports with one contraint. Is hidden if constraints == 2."""
@@ -205,11 +269,10 @@ class SupportShape(ComponentShape[Support]):
     def line_coords(self) -> Line:
         """Get the coordinates of the line below the triangle for supports with one constraint."""
         n_point = Point(self.component.node.x, self.component.node.y)
-        l_point = Point(int(n_point.x - self.WIDTH / 2), n_point.y + self.HEIGHT + self.LINE_SPACING)
-        r_point = Point(int(n_point.x + self.WIDTH / 2), n_point.y + self.HEIGHT + self.LINE_SPACING)
-        line = Line(l_point, r_point)
-        line.rotate(n_point, self.component.angle + 180)
-        return line
+        rotation = self.rotation
+        l_point = rotation.rotate(n_point, int(n_point.x - self.WIDTH / 2), n_point.y + self.HEIGHT + self.LINE_SPACING)
+        r_point = rotation.rotate(n_point, int(n_point.x + self.WIDTH / 2), n_point.y + self.HEIGHT + self.LINE_SPACING)
+        return Line(l_point, r_point)
 
     def default_style(self, *tags: str) -> dict[str, str]:
         """Get default, unselected style. Triangle is filled white with black outline."""
@@ -222,10 +285,7 @@ class SupportShape(ComponentShape[Support]):
     @property
     def label_position(self) -> Point:
         """Get the position of the label of this shape in the diagram. Returns position below triangle of SupportShape."""
-        n_point = Point(self.component.node.x, self.component.node.y)
-        point = Point(self.component.node.x, self.component.node.y + self.HEIGHT + self.LABEL_OFFSET)
-        point.rotate(n_point, self.component.angle + 180)
-        return point
+        return self.rotation.rotate_offset(Point(self.component.node.x, self.component.node.y), self.LABEL_POSITION)
 
     def scale(self, factor: float):
         """Scale the triangle and line to represent the current scaling of the diagram."""
@@ -238,17 +298,22 @@ class SupportShape(ComponentShape[Support]):
         Oupdate visibility of the line if constraints changed."""
         if component_id == self.component.id:
             if attribute_id in (NodeAttribute.ID, AngleAttribute.ID):
-                triangle = self.triangle_coords
-                self.tk_shapes[self.triangle_tk_id] = Polygon(triangle.p1, triangle.p2, triangle.p3)
-                line = self.line_coords
-                self.tk_shapes[self.line_tk_id] = Polygon(line.start, line.end)
-                self.update_label_pos()
-                self.diagram.refresh()
+                self.update_position()
+                self.diagram.shapes_moved()
             elif attribute_id == ConstraintsAttribute.ID:
                 self.update_line_visibility()
                 self.diagram.refresh()
         super().update_observer(component_id, attribute_id)
 
+    def update_position(self):
+        """Move the triangle, line and label to the Node's position and the angle of the Support. Only the tkinter shapes of this shape are changed."""
+        triangle = self.triangle_coords
+        self.tk_shapes[self.triangle_tk_id] = Polygon(triangle.p1, triangle.p2, triangle.p3)
+        line = self.line_coords
+        self.tk_shapes[self.line_tk_id] = Polygon(line.start, line.end)
+        self.update_label_pos()
+        self.redraw()
+
     def update_line_visibility(self):
         """Set the visibility of the line underneath the triangle based on the number of constraints of the Support."""
         line_visibility = tk.NORMAL if self.component.constraints == 1 else tk.HIDDEN
@@ -267,8 +332,14 @@ class ForceShape(ComponentShape[Force]):
 
     LABEL_OFFSET = 20
 
+    #offsets from the Node before rotation
+    ARROW_START: tuple[float, float] = (0, -DISTANCE_FROM_NODE)
+    ARROW_END: tuple[float, float] = (0, -DISTANCE_FROM_NODE - LENGTH)
+    LABEL_POSITION: tuple[float, float] = (LABEL_OFFSET, -DISTANCE_FROM_NODE - (LENGTH + ARROW_SHAPE[0]) / 2)
+
     def __init__(self, force: Force, diagram: 'ModelDiagram') -> None:
         """Create an instance of ForceShape."""
+        self.cache: RotatedGeometry[tuple[float, float, float, float]] = RotatedGeometry(self.arrow_segment)
         super().__init__(force, diagram)
         self.draw_arrow()
 
@@ -286,15 +357,17 @@ class ForceShape(ComponentShape[Force]):
                             tags=[*self.TAGS, str(self.component.id)])
         self.tk_shapes[self.arrow_tk_id] = Polygon(arrow.start, arrow.end)
 
+    @property
+    def rotation(self) -> Rotation:
+        """Get the rotation of the shape around its Node. Sine and cosine are only calculated again when the angle of the Force changed."""
+        return self.cache.rotation(self.component.angle)
+
     @property
     def arrow_coords(self) -> Line:
         """Get the position of the arrow that represents the Force in the diagram."""
         n = Point(self.component.node.x, self.component.node.y)
-        a1 = Point(n.x, n.y - self.DISTANCE_FROM_NODE)
-        a2 = Point(a1.x, a1.y - self.LENGTH)
-        line = Line(a1, a2)
-        line.rotate(n, self.component.angle)
-        return line
+        rotation = self.rotation
+        return Line(rotation.rotate_offset(n, self.ARROW_START), rotation.rotate_offset(n, self.ARROW_END))
 
     def default_style(self, *tags: str) -> dict[str, str]:
         """Get default, unselected style. Arrow is black."""
@@ -305,16 +378,30 @@ class ForceShape(ComponentShape[Force]):
         return {"fill": self.SELECTED_COLOR}
 
     def is_at(self, x: float, y: float) -> bool:
-        """Returns True if the shape is at the specified position in the diagram, False otherwise."""
-        return Point(x, y).distance_to_line(self.arrow_coords) < self.WIDTH/2
+        """Returns True if the shape is at the specified position in the diagram, False otherwise. 
+        Positions outside of the arrow's bounding box extended by half the line width are rejected before calculating the distance."""
+        start_x, start_y, end_x, end_y = self.hit_segment
+        margin = self.WIDTH / 2
+        if (x < min(start_x, end_x) - margin or x > max(start_x, end_x) + margin
+                or y < min(start_y, end_y) - margin or y > max(start_y, end_y) + margin):
+            return False
+        return segment_distance_squared(x, y, start_x, start_y, end_x, end_y) < margin * margin
+
+    @property
+    def hit_segment(self) -> tuple[float, float, float, float]:
+        """Get the start and end coordinates of the arrow used to check if the shape is at a position. They are cached, because they're needed for every hit test, 
+        and only calculated again when the Node's position or the angle of the Force changed."""
+        return self.cache.geometry(self.component.node, self.component.angle)
+
+    def arrow_segment(self) -> tuple[float, float, float, float]:
+        """Get the start and end coordinates of the arrow as plain floats."""
+        arrow = self.arrow_coords
+        return (arrow.start.x, arrow.start.y, arrow.end.x, arrow.end.y)
 
     @property
     def label_position(self) -> Point:
         """Get the position of the label of this shape in the diagram. Returns position to the right of the Force."""
-        n_point = Point(self.component.node.x, self.component.node.y)
-        point = Point(n_point.x + self.LABEL_OFFSET, n_point.y - self.DISTANCE_FROM_NODE - ((self.LENGTH + self.ARROW_SHAPE[0]) / 2))
-        point.rotate(n_point, self.component.angle)
-        return point
+        return self.rotation.rotate_offset(Point(self.component.node.x, self.component.node.y), self.LABEL_POSITION)
 
     def scale(self, factor: float):
         """Scale the arrowhead and the linewidth of the arrow to fit with current diagram scaling."""
@@ -325,16 +412,23 @@ class ForceShape(ComponentShape[Force]):
     def update_observer(self, component_id: str="", attribute_id: str=""):
         """Update the position of the arrow if the Force angle or Node position changed."""
         if component_id == self.component.id and attribute_id in (NodeAttribute.ID, AngleAttribute.ID):
-            arrow = self.arrow_coords
-            self.tk_shapes[self.arrow_tk_id] = Polygon(arrow.start, arrow.end)
-            self.update_label_pos()
-            self.diagram.refresh()
+            self.update_position()
+            self.diagram.shapes_moved()
         super().update_observer(component_id, attribute_id)
 
+    def update_position(self):
+        """Move the arrow and label to the Node's position and the angle of the Force. Only the tkinter shapes of this shape are changed."""
+        arrow = self.arrow_coords
+        self.tk_shapes[self.arrow_tk_id] = Polygon(arrow.start, arrow.end)
+        self.update_label_pos()
+        self.redraw()
+
 
 class ModelDiagram(TwlDiagram):
     """Base class for all Diagrams that display the Model."""
 
+    _node_positions: tuple[list[NodeShape], np.ndarray] | None = None #built on demand, reset on refresh
+
     def __init__(self, master):
         """Create an instance of ModelDiagram."""
         super().__init__(master)
@@ -344,32 +438,73 @@ class ModelDiagram(TwlDiagram):
         TwlApp.settings().show_force_labels.trace_add("write", lambda *ignore: self.refresh())
 
     def update_observer(self, component_id: str="", attribute_id: str=""):
-        """Updates the diagram whenever a component is added to or removed from the model."""
-        model_components = TwlApp.model().all_components
-        [shape.remove() for shape in self.component_shapes if not shape.component in model_components]
-
-        [self.shapes.append(NodeShape(node, self)) for node in TwlApp.model().nodes if not self.shapes_of_type_for(NodeShape, node)]
-        [self.shapes.append(BeamShape(beam, self)) for beam in TwlApp.model().beams if not self.shapes_of_type_for(BeamShape, beam)]
-        [self.shapes.append(SupportShape(support, self)) for support in TwlApp.model().supports if not self.shapes_of_type_for(SupportShape, support)]
-        [self.shapes.append(ForceShape(force, self)) for force in TwlApp.model().forces if not self.shapes_of_type_for(ForceShape, force)]
-
-        self.tag_raise(NodeShape.TAG)
-        self.tag_raise(ComponentShape.LABEL_BG_TAG)
-        self.tag_raise(ComponentShape.LABEL_TAG)
-
-        super().update_observer(component_id, attribute_id)
+        """Updates the diagram whenever a component is added to or removed from the model. 
+        Changes of a single component's attributes are handled by its shapes, so the shapes are only synced and refreshed for general updates."""
+        if not component_id:
+            self.sync_shapes()
+            super().update_observer(component_id, attribute_id)
+
+    def shapes_moved(self):
+        """Update the diagram after shapes were moved. The cached Node positions are no longer valid."""
+        self._node_positions = None
+        super().shapes_moved()
+
+    def sync_shapes(self):
+        """Remove the shapes of components that are no longer in the model and create shapes for the new ones. Existing shapes are kept."""
+        model = TwlApp.model()
+        model_components = set(model.all_components)
+        for shape in self.component_shapes:
+            if shape.component not in model_components:
+                shape.remove()
+
+        existing_shapes = {(type(shape), shape.component) for shape in self.component_shapes}
+        for shape_type, components in ((NodeShape, model.nodes), (BeamShape, model.beams), (SupportShape, model.supports), (ForceShape, model.forces)):
+            for component in components:
+                if (shape_type, component) not in existing_shapes:
+                    self.shapes.append(shape_type(component, self))
+        self.stack_shapes()
+
+    def stack_shapes(self):
+        """Bring the shapes into their stacking order, once for all shapes instead of every time a shape is created. 
+        Beams are at the bottom, followed by Supports, Forces and Nodes, with the labels on top."""
+        for tag in (BeamShape.TAG, SupportShape.TAG, ForceShape.TAG, NodeShape.TAG):
+            self.tag_raise(tag)
+        self.raise_labels()
+
+    def node_positions(self) -> tuple[list[NodeShape], np.ndarray]:
+        """Returns the NodeShapes of the diagram together with an array of their Node's coordinates of shape (number of NodeShapes, 2)."""
+        if self._node_positions is None:
+            node_shapes = [shape for shape in self.shapes if isinstance(shape, NodeShape)]
+            node_xy = np.array([(shape.component.x, shape.component.y) for shape in node_shapes], dtype=float).reshape(-1, 2)
+            self._node_positions = node_shapes, node_xy
+        return self._node_positions
+
+    def find_shape_of_type_at(self, component_type: Type[C], x: float, y: float) -> ComponentShape[C] | None:
+        """Returns component shape of the specified type in the diagram at the specified coordinate if it exists.
+        NodeShapes are found with one vectorized comparison of all Node positions instead of calling is_at for every shape."""
+        if component_type is not Node:
+            return super().find_shape_of_type_at(component_type, x, y)
+        node_shapes, node_xy = self.node_positions()
+        delta = node_xy - (x, y)
+        hits = np.flatnonzero((delta * delta).sum(axis=1) <= NodeShape.RADIUS_SQUARED)
+        return node_shapes[hits[0]] if hits.size else None
 
     def refresh(self):
         """Refresh the diagram and set correct label visibility based on selected settings."""
+        self._node_positions = None
         super().refresh()
         self.label_visibility()
 
-    def label_visible(self, shape: Shape) -> bool:
-        """Returns if the label of a shape should be visible in the diagram or not."""
-        visible: dict[type[Shape], bool] = {
-            NodeShape: TwlApp.settings().show_node_labels.get(),
-            BeamShape: TwlApp.settings().show_beam_labels.get(),
-            SupportShape: TwlApp.settings().show_support_labels.get(),
-            ForceShape: TwlApp.settings().show_force_labels.get()
+    def label_settings(self) -> dict[type[Shape], bool]:
+        """Returns the label setting of every shape type in the Model."""
+        settings = TwlApp.settings()
+        return {
+            NodeShape: settings.show_node_labels.get(),
+            BeamShape: settings.show_beam_labels.get(),
+            SupportShape: settings.show_support_labels.get(),
+            ForceShape: settings.show_force_labels.get()
         }
-        return visible.get(type(shape), True)
\ No newline at end of file
+
+    def label_visible(self, shape: Shape, settings: dict[type[Shape], bool]) -> bool:
+        """Returns if the label of a shape should be visible in the diagram or not."""
+        return settings.get(type(shape), True)
\ No newline at end of file
@@ -68,7 +68,8 @@ class ResultDiagram(ResultModelDiagram):
     def update_observer(self, component_id: str="", attribute_id: str=""):
         """Update the diagram by redrawing the BeamForcePlotShapes."""
         super().update_observer(component_id, attribute_id)
-        [shape.remove() for shape in self.shapes.copy() if isinstance(shape, BeamForcePlotShape)]
+        for shape in [shape for shape in self.shapes if isinstance(shape, BeamForcePlotShape)]:
+            shape.remove()
         self.draw_beam_force_plots()
         self.adjust_label_positions()
         self.refresh()
@@ -93,6 +94,6 @@ class ResultDiagram(ResultModelDiagram):
         if isinstance(shape, BeamForceShape) and round(shape.force.strength, 2) == 0:
             self.itemconfig(shape.circle_tk_id, fill=Colors.WHITE)
 
-    def label_visible(self, shape: Shape) -> bool:
+    def label_visible(self, shape: Shape, settings: dict[type[Shape], bool]) -> bool:
         """Returns if label for shape should be visible in the diagram. Labels are disabled for BeamForceShapes and BeamForcePlotShapes."""
-        return type(shape) not in (BeamForceShape, BeamForcePlotShape) and super().label_visible(shape)
\ No newline at end of file
+        return type(shape) not in (BeamForceShape, BeamForcePlotShape) and super().label_visible(shape, settings)
\ No newline at end of file
@@ -85,6 +85,7 @@ class ResultModelDiagram(ModelDiagram):
         super().update_observer(component_id, attribute_id)
         self.add_support_forces()
         self.add_beam_forces()
+        self.raise_labels()
         self.label_visibility()
 
     def add_support_forces(self):
@@ -98,8 +99,11 @@ class ResultModelDiagram(ModelDiagram):
 
     def add_beam_forces(self):
         """Add Beam forces to the diagram."""
-        [shape.remove() for shape in self.shapes.copy() if isinstance(shape, BeamForceShape)]
-        [self.reset_label_position(shape) for shape in self.shapes if isinstance(shape, BeamShape)]
+        for shape in [shape for shape in self.shapes if isinstance(shape, BeamForceShape)]:
+            shape.remove()
+        for shape in self.shapes:
+            if isinstance(shape, BeamShape):
+                self.reset_label_position(shape)
         beam_forces = {force: component for force, component in TwlApp.solver().solution.items() if isinstance(component, Beam)}
         for force, beam in beam_forces.items():
             self.shapes.append(BeamForceShape(beam, force, self))
@@ -135,7 +139,7 @@ class ResultModelDiagram(ModelDiagram):
         beam_shape.tk_shapes[beam_shape.label_tk_id].move(delta_x, delta_y)
         beam_shape.tk_shapes[beam_shape.label_bg_tk_id].move(delta_x, delta_y)
 
-    def label_visible(self, shape: Shape) -> bool:
+    def label_visible(self, shape: Shape, settings: dict[type[Shape], bool]) -> bool:
         """Returns if label should be visible for shape in diagram. Labels for SupportShapes and BeamForceShapes are disabled.
         SupportShape labels are not necessary in this diagram because the Support is labeled by it's reaction forces."""
-        return type(shape) not in (SupportShape, BeamForceShape) and super().label_visible(shape)
\ No newline at end of file
+        return type(shape) not in (SupportShape, BeamForceShape) and super().label_visible(shape, settings)
\ No newline at end of file
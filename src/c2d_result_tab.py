@@ -34,7 +34,7 @@ class ResultTab(TwlTab):
         """Update all UI widgets in the tab with the newest results from the solver."""
         self.beams_table.component_list = self.get_result_forces(Beam)
         self.supports_table.component_list = self.get_result_forces(Support)
-        [table.update_observer() for table in self.tables]
+        for table in self.tables: table.update_observer()
         self.result_diagram.update_observer()
 
     def create_diagram(self, frame: ttk.Frame):
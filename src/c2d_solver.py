@@ -1,10 +1,14 @@
+import logging
 import numpy as np
 import math
 
-from c2d_math import Orientation, Point, Line
+from c2d_math import Orientation
 from c2d_components import Model, Component, Node, Beam, Force
 
 
+log = logging.getLogger(__name__)
+
+
 class Solver:
     """Converts the Model into a system of linear equations and uses numpy to solve those equations."""
 
@@ -24,11 +28,8 @@ class Solver:
 
         self.solution = self.get_unknown_forces()
 
-        for node in self.model.nodes:
-            self.factor_matrix.append(self.get_node_factors(node, Orientation.HORIZONTAL))
-            self.factor_matrix.append(self.get_node_factors(node, Orientation.VERTICAL))
-            self.result_vector.append(self.get_node_forces(node, Orientation.HORIZONTAL))
-            self.result_vector.append(self.get_node_forces(node, Orientation.VERTICAL))
+        self.factor_matrix = self.get_factor_matrix()
+        self.result_vector = self.get_result_vector()
 
         np_solution = np.linalg.solve(self.factor_matrix, self.result_vector).tolist()
         for i, force in enumerate(self.solution.keys()):
@@ -55,53 +56,68 @@ class Solver:
             unknown_forces[Force.dummy(beam.id, angle=beam.angle)] = beam
         return unknown_forces
 
-    def get_node_factors(self, node: Node, orientation: Orientation) -> list[float]:
-        """Get all the factors for one Node and orientation for a row of the factor matrix A in Ax = b.
-        Specifies for all unknown forces in the Model the extend to which these forces are present on the Node in the specified orientation/direction."""
-        factors: list[float] = []
+    def get_factor_matrix(self) -> list[list[float]]:
+        """Get the factor matrix A of Ax = b. Every Node has a row for the horizontal and one for the vertical direction, every unknown force has a column.
+        An entry specifies the extend to which the unknown force is present on the Node in that direction. Supports with 2 constraints have one unknown force 
+        for each direction, the factors of all other unknown forces are calculated at once with numpy from the angle they have at their Node(s)."""
+        node_rows = {node: 2 * i for i, node in enumerate(self.model.nodes)}
+        factor_matrix = np.zeros((len(node_rows) * 2, len(self.solution)))
+        rows: list[int] = []
+        columns: list[int] = []
+        angles: list[float] = []
+        column = 0
         for support in self.model.supports:
-            support_factors = self.generate_factors((support.angle + 180) % 360)
-            factors.extend(support_factors[(support in node.supports, support.constraints, orientation)])
+            row = node_rows[support.node]
+            if support.constraints == 2:
+                factor_matrix[row, column] = 1
+                factor_matrix[row + 1, column + 1] = 1
+                column += 2
+                continue
+            rows.append(row)
+            columns.append(column)
+            angles.append((support.angle + 180) % 360)
+            column += 1
         for beam in self.model.beams:
-            beam_factors = self.generate_factors(self.beam_angle(node, beam))
-            factors.extend(beam_factors[(beam in node.beams, 1, orientation)])
-        return factors
-
-    def get_node_forces(self, node: Node, orientation: Orientation) -> float:
-        """Get the sum of the strength of all Force components in the Model on this Node in the specified orientation.
-        This is used for the entry for the Node in the result vector b of Ax = b."""
-        forces: list[float] = []
-        for force in self.model.forces:
-            force_factors = self.generate_factors((force.angle + 180) % 360)
-            forces.append(force_factors[(force in node.forces, 1, orientation)][0] * force.strength)
-        return -sum(forces)
-
-    def generate_factors(self, angle: float) -> dict[tuple[bool, int, Orientation], list[float]]:
-        """Get a mapping for a factor for an unknown force on a Node depending on if the force exists on the Node, how many constraints it has 
-        (only relevant if it's a Support), and in which orientation I'm interested. If it doesn't exist or doesn't go at all in the specified direction
-        then the factor is 0. If it exists and goes completely in the specified direction the factor is 1. If it goes in part in the specified direction then
-        the factor is determined using sin/cos."""
-        return {
-            #(exists on node, no of constraints, orientation): factors
-            (True, 1, Orientation.HORIZONTAL): [math.sin(math.radians(angle))],
-            (True, 1, Orientation.VERTICAL): [math.cos(math.radians(angle))],
-            (True, 2, Orientation.HORIZONTAL): [1, 0],
-            (True, 2, Orientation.VERTICAL): [0, 1],
-            (False, 1, Orientation.HORIZONTAL): [0],
-            (False, 1, Orientation.VERTICAL): [0],
-            (False, 2, Orientation.HORIZONTAL): [0, 0],
-            (False, 2, Orientation.VERTICAL): [0, 0]
-        }
+            for node in (beam.start_node, beam.end_node):
+                rows.append(node_rows[node])
+                columns.append(column)
+                angles.append(self.beam_angle(node, beam))
+            column += 1
+        rows_array = np.array(rows, dtype=int)
+        angles_array = np.radians(angles)
+        factor_matrix[rows_array, columns] = np.sin(angles_array)
+        factor_matrix[rows_array + 1, columns] = np.cos(angles_array)
+        return factor_matrix.tolist()
+
+    def get_result_vector(self) -> list[float]:
+        """Get the result vector b of Ax = b. For every Node it contains the negative sum of the Forces on the Node, 
+        first in horizontal and then in vertical direction. The components of all Forces are calculated at once with numpy."""
+        node_rows = {node: 2 * i for i, node in enumerate(self.model.nodes)}
+        forces = self.model.forces
+        rows = np.array([node_rows[force.node] for force in forces], dtype=int)
+        angles = np.radians([force.angle for force in forces])
+        strengths = np.array([force.strength for force in forces], dtype=float)
+        result_vector = np.zeros(len(node_rows) * 2)
+        np.add.at(result_vector, rows, strengths * np.sin(angles))
+        np.add.at(result_vector, rows + 1, strengths * np.cos(angles))
+        return result_vector.tolist()
 
     def beam_angle(self, node: Node, beam: Beam) -> float:
-        """Get the angle of a beam relative to the specified Node (using the Node as the start Node)."""
-        if beam in node.beams:
-            other_node = beam.start_node if beam.start_node != node else beam.end_node
-            return Line(Point(node.x, node.y), Point(other_node.x, other_node.y)).angle()
-        return beam.angle
+        """Get the angle of a beam relative to the specified Node (using the Node as the start Node). 
+        Uses the same formula as Line.angle on the Node coordinates directly."""
+        if node == beam.start_node:
+            other_node = beam.end_node
+        elif node == beam.end_node:
+            other_node = beam.start_node
+        else:
+            return beam.angle
+        return (90 - math.degrees(math.atan2(node.y - other_node.y, other_node.x - node.x))) % 360
 
     def print_result(self):
-        """Used for debug-purposes to print a readable representation of the matrix equation and the solution vector in the console."""
+        """Used for debug-purposes to log a readable representation of the matrix equation and the solution vector. 
+        The rows are only formatted if debug logging is enabled."""
+        if not log.isEnabledFor(logging.DEBUG):
+            return
         unknown_forces = list(self.solution.keys())
 
         prefix_max_width = max(len(node.id) for node in self.model.nodes) + 8
@@ -117,7 +133,7 @@ class Solver:
             space1 = "   " if i != center_index else " x "
             space2 = "   " if i != center_index else " = "
             space3 = "    " if i != center_index else " -> "
-            print(prefix + "[{}]".format(" ".join(self.format_float(factor).ljust(factors_max_width) for factor in self.factor_matrix[i])) 
+            log.debug(prefix + "[{}]".format(" ".join(self.format_float(factor).ljust(factors_max_width) for factor in self.factor_matrix[i])) 
                   + space1 + f"[{unknown_forces[i].id.ljust(unknowns_max_width)}]" 
                   + space2 + f"[{self.format_float(self.result_vector[i]).ljust(result_max_width)}]" 
                   + space3 + f"[{self.format_float(unknown_forces[i].strength).ljust(solved_max_width)}]")
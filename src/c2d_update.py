@@ -1,4 +1,5 @@
 from abc import abstractmethod
+from contextlib import contextmanager
 
 
 class Observer:
@@ -15,23 +16,39 @@ class UpdateManager:
 
     def __init__(self) -> None:
         """Create an instance of UpdateManager."""
-        self._paused: bool = False
+        self._paused: int = 0 #number of pauses that weren't resumed yet
         self._observers: list[Observer] = []
 
     def pause_observing(self):
-        """Pause the UpdateManager from notifying its Observers for updates. Resume with UpdateManager.resume()."""
-        self._paused = True
+        """Pause the UpdateManager from notifying its Observers for updates. Resume with UpdateManager.resume().
+        Pauses can be nested, the Observers are only notified again after every pause is resumed."""
+        self._paused += 1
 
     def resume_observing(self):
-        """Resume notifying Observers for updates."""
-        self._paused = False
-        self.notify_observers()
+        """Resume notifying Observers for updates. Notifies the Observers once the last pause is resumed."""
+        self._paused = max(self._paused - 1, 0)
+        if not self._paused:
+            self.notify_observers()
+
+    @contextmanager
+    def paused(self):
+        """Pause notifying Observers while changes are made in the with block. They are notified once at the end, also if an exception is raised."""
+        self.pause_observing()
+        try:
+            yield
+        finally:
+            self.resume_observing()
 
     def register_observer(self, observer: Observer):
         """Add an Observer to the UpdateManager's Observer list."""
         self._observers.append(observer)
 
+    def unregister_observer(self, observer: Observer):
+        """Remove an Observer from the UpdateManager's Observer list if it is registered."""
+        if observer in self._observers:
+            self._observers.remove(observer)
+
     def notify_observers(self, component_id: str="", attribute_id: str=""):
         """Notify Observers to update themselves. Doesn't do anything while the UpdateManager is paused."""
         if not self._paused:
-            for observer in self._observers: observer.update_observer(component_id, attribute_id)
\ No newline at end of file
+            for observer in self._observers.copy(): observer.update_observer(component_id, attribute_id)
\ No newline at end of file
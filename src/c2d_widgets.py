@@ -152,14 +152,14 @@ class CustomRadioButton(CustomToggleButton):
         self.configure(style="Selected.Radio.TButton" if self.state.get() else "Radio.TButton")
 
     def toggle(self):
-        """Switch the state of the button and set the connected variable to this buttons value."""
-        super().toggle()
+        """Select this button by setting the connected variable to this buttons value. The state of all buttons of the group follows the variable."""
         self.variable.set(self.value)
 
     def on_toggle(self, command):
-        """When this button is toggled, switch the style of this button to reflect the new state."""
+        """When this button is toggled, switch the style of this button to reflect the new state. 
+        The command is only executed for the button that is selected, so it runs once when the selection of the group changes."""
         self.configure(style="Selected.Radio.TButton" if self.state.get() else "Radio.TButton")
-        return super().on_toggle(command)
+        return super().on_toggle(command if self.state.get() else self.default_command)
 
     def on_radio_toggle(self):
         """Executed when there is a change to the variable this radio button is connected to, for example by another radio button with the same variable
@@ -243,7 +243,9 @@ class CustomEntry(tk.Entry):
 
     def __init__(self, master, validator, **kwargs):
         """Create an instance of CustomEntry."""
-        self.popup = None
+        self.popup: tk.Toplevel | None = None
+        self.popup_label: tk.Label | None = None
+        self.popup_visible = False
         self.validator = validator
         self.variable = tk.StringVar()
         kwargs["validate"] = "key"
@@ -263,35 +265,31 @@ class CustomEntry(tk.Entry):
         return True
 
     def show_popup(self, message):
-        """Show warning popup with the specified message."""
-        if self.popup:
-            self.popup.destroy()
+        """Show warning popup with the specified message. The popup window is created once and reused, 
+        only its text and position are updated for following warnings."""
+        if self.popup is None:
+            self.popup = tk.Toplevel(self)
+            self.popup.overrideredirect(True)
+            self.popup.attributes("-topmost", True)
+            #self.popup.attributes('-alpha', 0.6)
+            self.popup_label = tk.Label(self.popup, wraplength=self.POPUP_WIDTH)
+            self.popup_label.pack(expand=True, fill="both")
         x, y, width = self.winfo_rootx(), self.winfo_rooty() + self.winfo_height(), self.winfo_width()
 
         #add warning sign icon
-        message = "\u26A0 " + message
+        self.popup_label.config(text="\u26A0 " + message)
+        req_height = self.popup_label.winfo_reqheight()
 
-        #create a temporary label to measure the required height
-        temp_label = tk.Label(self, text=message, wraplength=self.POPUP_WIDTH)
-        temp_label.pack_forget()  # Pack and forget to trigger geometry computation
-        req_height = temp_label.winfo_reqheight()
-
-        #create the popup window
-        self.popup = tk.Toplevel(self)
         self.popup.geometry(f"{self.POPUP_WIDTH}x{req_height}+{round(x - ((self.POPUP_WIDTH - width) / 2))}+{y - req_height - self.winfo_height()}")
-        self.popup.overrideredirect(True)
-        self.popup.attributes("-topmost", True)
-        #self.popup.attributes('-alpha', 0.6)
-
-        #create the label with the error message and pack it into the popup window
-        label = tk.Label(self.popup, text=message, wraplength=self.POPUP_WIDTH)
-        label.pack(expand=True, fill="both")
+        if not self.popup_visible:
+            self.popup.deiconify()
+            self.popup_visible = True
 
     def hide_popup(self):
-        """Hide the warning popup if it exists."""
-        if self.popup:
-            self.popup.destroy()
-            self.popup = None
+        """Hide the warning popup if it is visible. The window is kept to be shown again for the next warning."""
+        if self.popup_visible:
+            self.popup.withdraw()
+            self.popup_visible = False
 
 class ValidationText(tk.Text):
     """Custom expandable text widget that is used for the validation text at the top of DefinitionDiagram."""
@@ -301,6 +299,12 @@ class ValidationText(tk.Text):
         super().__init__(master, kwargs)
         self.is_expanded = False
         self.action = action
+        self.font = tkfont.Font(font=FONT)
+        self.char_width = self.font.measure("0")
+        self.tag_config("button", foreground=Colors.BLACK, underline=True)
+        self.tag_bind("button", "<Button-1>", self.on_action)
+        self.tag_bind("button", "<Enter>", lambda event: event.widget.config(cursor="hand2"))
+        self.tag_bind("button", "<Leave>", lambda event: event.widget.config(cursor=""))
 
     def clear(self):
         """Remove all text from the widget."""
@@ -324,11 +328,7 @@ class ValidationText(tk.Text):
         text = "show less" if self.is_expanded else "show more"
         start = self.index("end-1c")
         self.insert(tk.END, f"\n{text}")
-        self.tag_add("button", start, tk.END)
-        self.tag_config("button", foreground=Colors.BLACK, underline=True)
-        self.tag_bind("button", "<Button-1>", self.on_action)
-        self.tag_bind("button", "<Enter>", lambda event: event.widget.config(cursor="hand2"))
-        self.tag_bind("button", "<Leave>", lambda event: event.widget.config(cursor=""))
+        self.tag_add("button", start, tk.END) #style and bindings of the tag are configured once when the widget is created
         self.resize()
         self.config(state=tk.DISABLED)
 
@@ -339,6 +339,7 @@ class ValidationText(tk.Text):
 
     def resize(self):
         """Resize the widget size to fit exactly with it's content."""
-        width = max(tkfont.Font(font=FONT).measure(line) for line in self.get("1.0", tk.END).split("\n"))
-        height = len(self.get("1.0", tk.END).split("\n")) - 1
-        self.config(width=(width // tkfont.Font(font=FONT).measure("0") + 1), height=height)
\ No newline at end of file
+        lines = self.get("1.0", tk.END).split("\n")
+        width = max(self.font.measure(line) for line in lines)
+        height = len(lines) - 1
+        self.config(width=(width // self.char_width + 1), height=height)
\ No newline at end of file